@@ -206,7 +206,7 @@ class NodeFlowVisualizer:
                 memory_usage=0,  # Not tracked in replay
                 status="success" if result.success else "failed",
                 timestamp=step.timestamp,
-                input_size=len(str(step.input_data.data)),
+                input_size=len(step.input_data.data),
                 output_size=len(str(result.actual_output)) if result.actual_output else 0,
                 bottlenecks=result.differences
             )
@@ -10,27 +10,41 @@ Part of Milestone 2: Individual Node Testing & Workflow Debugging
 """
 
 import asyncio
-import cProfile
-import pstats
-import psutil
+import contextvars
+import functools
+import os
+import re
+import threading
 import time
-import tracemalloc
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Tuple
+from typing import Dict, Any, List, Optional, Callable, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
 import sys
 import io
 
+try:
+    import msgspec  # Optional: C-speed report encoding
+except ImportError:
+    msgspec = None
+
+try:
+    import resource  # Block I/O counters; not available on Windows
+except ImportError:
+    resource = None
+
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from state import ReviewState, ReviewStatus
-from nodes import start_review_node, analyze_code_node, generate_report_node, error_handler_node
-from scripts.node_tracing import get_tracer, traced_node
 from logging_config import get_logger, initialize_logging, LoggingConfig
 
+# psutil, cProfile, pstats, tracemalloc and the workflow nodes are imported
+# where they are used so that importing the metric types stays cheap
+if TYPE_CHECKING:
+    import pstats
+
 # Initialize logging
 initialize_logging(LoggingConfig(
     log_level="INFO",
@@ -42,8 +56,63 @@ initialize_logging(LoggingConfig(
 
 logger = get_logger(__name__)
 
+# Long-lived report encoder; msgspec.json.encode(..., enc_hook=...) would
+# build a new Encoder on every call
+_REPORT_ENCODER = msgspec.json.Encoder(enc_hook=str) if msgspec is not None else None
+
+
+def _profiled_call(profiler, func: Callable, *args) -> Any:
+    """Call func with profiler enabled in the calling thread.
+    
+    cProfile only sees the thread that enabled it, so synchronous nodes run
+    in an executor thread are profiled from inside that thread.
+    """
+    profiler.enable()
+    try:
+        return func(*args)
+    finally:
+        profiler.disable()
+
+
+# Function-name words that indicate a blocking call in cProfile output
+_BLOCKING_CALL_NAMES = frozenset({"sleep", "wait", "lock"})
 
-@dataclass
+
+@functools.lru_cache(maxsize=64)
+def _suggest(exec_bucket: int, mem_bucket: int, growth_bucket: int,
+             calls_bucket: int, io_bucket: int) -> Tuple[str, ...]:
+    """Optimization suggestions for a combination of threshold buckets."""
+    suggestions = []
+    
+    # Execution time optimizations
+    if exec_bucket:
+        suggestions.append("Consider optimizing algorithm complexity")
+        suggestions.append("Review synchronous operations that could be asynchronous")
+    
+    # Memory optimizations
+    if mem_bucket:
+        suggestions.append("Consider implementing memory pooling")
+        suggestions.append("Review data structures for memory efficiency")
+        suggestions.append("Implement lazy loading for large datasets")
+    
+    if growth_bucket:
+        suggestions.append("Check for memory leaks")
+        suggestions.append("Implement proper cleanup of temporary objects")
+    
+    # Function call optimizations
+    if calls_bucket:
+        suggestions.append("High function call count - consider function inlining")
+        suggestions.append("Review recursive algorithms for optimization")
+    
+    # I/O optimizations
+    if io_bucket:
+        suggestions.append("High I/O operations - consider batching")
+        suggestions.append("Implement caching for frequently accessed data")
+    
+    return tuple(suggestions)
+
+
+@dataclass(slots=True, frozen=True)
 class MemorySnapshot:
     """Memory usage snapshot."""
     timestamp: str
@@ -53,7 +122,7 @@ class MemorySnapshot:
     available_memory_mb: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Comprehensive performance metrics for node execution."""
     node_name: str
@@ -69,7 +138,7 @@ class PerformanceMetrics:
     profile_data: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfilingSession:
     """Complete profiling session data."""
     session_id: str
@@ -106,7 +175,34 @@ class NodeProfiler:
                 self.profile_output_dir = None
         
         self.profiling_sessions: List[ProfilingSession] = []
-        self.current_session: Optional[ProfilingSession] = None
+        # The active session is task-local so concurrently running workflows
+        # each see their own session; tasks spawned while a session is active
+        # (e.g. via asyncio.gather) inherit it through the copied context.
+        self._current_session_var: contextvars.ContextVar[Optional[ProfilingSession]] = \
+            contextvars.ContextVar(f"profiling_session_{id(self)}", default=None)
+        self._session_mono_starts: Dict[str, float] = {}
+        # True while this profiler owns tracemalloc. Tracing is started by the
+        # first session and stays on across sessions (only the peak is reset)
+        # until stop_memory_tracking() is called at shutdown
+        self._tm_owned = False
+        
+        # Reusable CPU profiler; the lock guards its enable/disable region.
+        # cProfile hooks the whole thread, so only one in-flight node can own
+        # it, and its stats are discarded if another node ran meanwhile.
+        self._profiler_instance = None
+        if enable_cpu_profiling:
+            import cProfile
+            self._profiler_instance = cProfile.Profile()
+        # Reused buffer for rendered profile stats, also guarded by _profile_lock
+        self._stats_buf = io.StringIO()
+        
+        if resource is None:
+            logger.warning("resource module unavailable; io_operations will be reported as 0")
+        self._profile_lock = threading.Lock()
+        # Profiled nodes currently running and started so far, used to detect
+        # nodes that overlapped with a CPU-profiled one
+        self._nodes_in_flight = 0
+        self._nodes_started = 0
         
         # Performance thresholds
         self.thresholds = {
@@ -119,6 +215,7 @@ class NodeProfiler:
         }
         
         # Available nodes for profiling
+        from nodes import start_review_node, analyze_code_node, generate_report_node, error_handler_node
         self.available_nodes = {
             "start_review_node": start_review_node,
             "analyze_code_node": analyze_code_node,
@@ -126,6 +223,15 @@ class NodeProfiler:
             "error_handler_node": error_handler_node
         }
     
+    @property
+    def current_session(self) -> Optional[ProfilingSession]:
+        """Profiling session active in the current context."""
+        return self._current_session_var.get()
+    
+    @current_session.setter
+    def current_session(self, session: Optional[ProfilingSession]):
+        self._current_session_var.set(session)
+    
     def start_profiling_session(self, session_name: str = None) -> str:
         """Start a new profiling session."""
         session_id = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
@@ -139,43 +245,55 @@ class NodeProfiler:
             metrics=[],
             session_summary={}
         )
+        self._session_mono_starts[session_id] = time.monotonic()
         
         if self.enable_memory_tracking:
-            tracemalloc.start()
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(1)
+                self._tm_owned = True
+            tracemalloc.reset_peak()
         
         logger.info(f"Started profiling session: {session_id}")
         return session_id
     
     def end_profiling_session(self) -> Optional[ProfilingSession]:
         """End the current profiling session."""
-        if not self.current_session:
+        session = self.current_session
+        if not session:
             logger.warning("No active profiling session to end")
             return None
         
-        self.current_session.end_time = datetime.now().isoformat()
-        start_time = datetime.fromisoformat(self.current_session.start_time)
-        end_time = datetime.fromisoformat(self.current_session.end_time)
-        self.current_session.total_duration = (end_time - start_time).total_seconds()
+        # Wall-clock timestamps are for display only; duration uses the monotonic clock
+        session.end_time = datetime.now().isoformat()
+        session.total_duration = time.monotonic() - self._session_mono_starts.pop(session.session_id)
         
         # Generate session summary
-        self.current_session.session_summary = self._generate_session_summary(self.current_session)
-        
-        # Stop memory tracking
-        if self.enable_memory_tracking:
-            tracemalloc.stop()
+        session.session_summary = self._generate_session_summary(session)
         
         # Archive session
-        self.profiling_sessions.append(self.current_session)
-        completed_session = self.current_session
+        self.profiling_sessions.append(session)
         self.current_session = None
         
-        logger.info(f"Ended profiling session: {completed_session.session_id}, "
-                   f"Duration: {completed_session.total_duration:.3f}s")
+        logger.info(f"Ended profiling session: {session.session_id}, "
+                   f"Duration: {session.total_duration:.3f}s")
         
-        return completed_session
+        return session
+    
+    def stop_memory_tracking(self):
+        """Stop tracemalloc if this profiler started it.
+        
+        Call once profiling is finished for good; tracing slows every
+        allocation in the process.
+        """
+        if self._tm_owned:
+            import tracemalloc
+            tracemalloc.stop()
+            self._tm_owned = False
     
     def _get_memory_snapshot(self) -> MemorySnapshot:
         """Get current memory usage snapshot."""
+        import psutil
         process = psutil.Process()
         memory_info = process.memory_info()
         memory_percent = process.memory_percent()
@@ -192,132 +310,176 @@ class NodeProfiler:
         )
     
     def _analyze_bottlenecks(self, execution_time: float, memory_usage: MemorySnapshot,
-                           profile_stats: Optional[pstats.Stats]) -> List[str]:
+                           profile_stats: Optional["pstats.Stats"]) -> List[str]:
         """Analyze performance data to identify bottlenecks."""
         bottlenecks = []
+        t = self.thresholds
+        current_memory_mb = memory_usage.current_memory_mb
         
         # Execution time bottlenecks
-        if execution_time > self.thresholds["execution_time_critical"]:
+        if execution_time > t["execution_time_critical"]:
             bottlenecks.append(f"Critical execution time: {execution_time:.3f}s")
-        elif execution_time > self.thresholds["execution_time_warning"]:
+        elif execution_time > t["execution_time_warning"]:
             bottlenecks.append(f"High execution time: {execution_time:.3f}s")
         
         # Memory bottlenecks
-        if memory_usage.current_memory_mb > self.thresholds["memory_usage_critical"]:
-            bottlenecks.append(f"Critical memory usage: {memory_usage.current_memory_mb:.1f}MB")
-        elif memory_usage.current_memory_mb > self.thresholds["memory_usage_warning"]:
-            bottlenecks.append(f"High memory usage: {memory_usage.current_memory_mb:.1f}MB")
+        if current_memory_mb > t["memory_usage_critical"]:
+            bottlenecks.append(f"Critical memory usage: {current_memory_mb:.1f}MB")
+        elif current_memory_mb > t["memory_usage_warning"]:
+            bottlenecks.append(f"High memory usage: {current_memory_mb:.1f}MB")
         
         # CPU profiling bottlenecks
         if profile_stats:
-            # Get top time-consuming functions
-            stats_stream = io.StringIO()
-            profile_stats.print_stats(10)  # Top 10 functions
-            stats_output = stats_stream.getvalue()
-            
-            # Simple heuristic: if any function takes more than 50% of total time
-            for line in stats_output.split('\n'):
-                if 'cumulative' in line and any(func in line for func in ['sleep', 'wait', 'lock']):
+            # Simple heuristic: a blocking-style call among the top 10 functions
+            # (already sorted by cumulative time) that takes more than 50% of total time
+            stats = profile_stats.stats
+            blocking_threshold = profile_stats.total_tt * 0.5
+            for func in profile_stats.fcn_list[:10]:
+                # Match whole words so e.g. importlib's "_load_unlocked" is not a hit
+                func_words = set(re.split(r"[^a-z]+", func[2].lower()))
+                if stats[func][3] > blocking_threshold and func_words & _BLOCKING_CALL_NAMES:
                     bottlenecks.append("Potential blocking operation detected")
                     break
         
         return bottlenecks
     
-    def _generate_optimization_suggestions(self, metrics: PerformanceMetrics) -> List[str]:
+    def _generate_optimization_suggestions(self, execution_time: float, memory_usage: MemorySnapshot,
+                                           memory_growth: float, function_calls: int,
+                                           io_operations: int) -> List[str]:
         """Generate optimization suggestions based on performance metrics."""
-        suggestions = []
-        
-        # Execution time optimizations
-        if metrics.execution_time > self.thresholds["execution_time_warning"]:
-            suggestions.append("Consider optimizing algorithm complexity")
-            suggestions.append("Review synchronous operations that could be asynchronous")
-        
-        # Memory optimizations
-        if metrics.memory_usage.current_memory_mb > self.thresholds["memory_usage_warning"]:
-            suggestions.append("Consider implementing memory pooling")
-            suggestions.append("Review data structures for memory efficiency")
-            suggestions.append("Implement lazy loading for large datasets")
-        
-        if metrics.memory_growth > self.thresholds["memory_growth_warning"]:
-            suggestions.append("Check for memory leaks")
-            suggestions.append("Implement proper cleanup of temporary objects")
-        
-        # Function call optimizations
-        if metrics.function_calls > 10000:
-            suggestions.append("High function call count - consider function inlining")
-            suggestions.append("Review recursive algorithms for optimization")
-        
-        # I/O optimizations
-        if metrics.io_operations > 100:
-            suggestions.append("High I/O operations - consider batching")
-            suggestions.append("Implement caching for frequently accessed data")
-        
-        return suggestions
+        t = self.thresholds
+        return list(_suggest(
+            int(execution_time > t["execution_time_warning"]),
+            int(memory_usage.current_memory_mb > t["memory_usage_warning"]),
+            int(memory_growth > t["memory_growth_warning"]),
+            int(function_calls > 10000),
+            int(io_operations > 100),
+        ))
     
     async def profile_node_execution(self, node_name: str, input_state: ReviewState) -> PerformanceMetrics:
         """Profile a single node execution with comprehensive metrics."""
-        if not self.current_session:
+        # Resolve per-call lookups once; this wrapper's own overhead is
+        # included in the timings it records
+        session = self.current_session
+        if not session:
             raise RuntimeError("No active profiling session. Call start_profiling_session() first.")
         
-        if node_name not in self.available_nodes:
+        node_func = self.available_nodes.get(node_name)
+        if node_func is None:
             raise ValueError(f"Unknown node: {node_name}")
         
         logger.info(f"Profiling node execution: {node_name}")
         
-        node_func = self.available_nodes[node_name]
-        
         # Get initial memory snapshot
         initial_memory = self._get_memory_snapshot()
         
-        # Setup CPU profiling
+        # Setup CPU profiling with the shared profiler unless another
+        # concurrently profiled node currently holds it
         profiler = None
         if self.enable_cpu_profiling:
-            profiler = cProfile.Profile()
-            profiler.enable()
-        
-        # Execute node with timing
-        start_time = time.time()
-        cpu_start = time.process_time()
-        
-        try:
-            result = await node_func(input_state)
-            success = True
-            error_message = None
-        except Exception as e:
-            result = None
-            success = False
-            error_message = str(e)
-            logger.error(f"Error during profiling: {e}")
-        
-        # Stop timing
-        execution_time = time.time() - start_time
-        cpu_time = time.process_time() - cpu_start
-        
-        # Stop CPU profiling
+            if self._profiler_instance is not None and self._profile_lock.acquire(blocking=False):
+                profiler = self._profiler_instance
+            else:
+                logger.debug(f"CPU profiler busy, profiling {node_name} without cProfile")
+        
+        overlapped = self._nodes_in_flight > 0
+        self._nodes_in_flight += 1
+        self._nodes_started += 1
+        started_count = self._nodes_started
+        
+        # The profiler must be disabled and released even if the node raises
+        # something other than Exception (e.g. CancelledError)
         profile_stats = None
         profile_data = None
-        if profiler:
-            profiler.disable()
-            profile_stats = pstats.Stats(profiler)
+        is_async = asyncio.iscoroutinefunction(node_func)
+        try:
+            if profiler:
+                profiler.clear()
+                if is_async:
+                    profiler.enable()
+            
+            # Per-node memory peak: reset right before the node runs
+            traced_start = 0
+            if self.enable_memory_tracking:
+                import tracemalloc
+                tracemalloc.reset_peak()
+                traced_start = tracemalloc.get_traced_memory()[0]
+            
+            # Execute node with timing
+            rusage_start = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+            start_time = time.time()
+            cpu_start = time.process_time()
             
-            # Capture profile data as string
-            stats_stream = io.StringIO()
-            profile_stats.print_stats()
-            profile_data = stats_stream.getvalue()
+            try:
+                if is_async:
+                    result = await node_func(input_state)
+                elif profiler:
+                    # Synchronous nodes must not block the event loop
+                    result = await asyncio.to_thread(_profiled_call, profiler, node_func, input_state)
+                else:
+                    result = await asyncio.to_thread(node_func, input_state)
+                success = True
+                error_message = None
+            except Exception as e:
+                result = None
+                success = False
+                error_message = str(e)
+                logger.error(f"Error during profiling: {e}")
+            
+            # Stop timing
+            execution_time = time.time() - start_time
+            cpu_time = time.process_time() - cpu_start
+            
+            # Get memory peak if available, relative to the traced memory at node start
+            memory_peak = 0
+            if self.enable_memory_tracking:
+                traced_peak = tracemalloc.get_traced_memory()[1]
+                memory_peak = max(0, traced_peak - traced_start) / 1024 / 1024  # Convert to MB
+            
+            # Block input/output operations performed while the node ran
+            io_operations = 0
+            if rusage_start is not None:
+                rusage_end = resource.getrusage(resource.RUSAGE_SELF)
+                io_operations = ((rusage_end.ru_inblock - rusage_start.ru_inblock)
+                                 + (rusage_end.ru_oublock - rusage_start.ru_oublock))
+            
+            # Stop CPU profiling. cProfile sees every coroutine the loop ran
+            # during the node's awaits, so if another node overlapped it the
+            # stats would be misattributed and are dropped.
+            if profiler:
+                profiler.disable()
+                if overlapped or self._nodes_started != started_count:
+                    logger.debug(f"{node_name} overlapped other profiled nodes, dropping its CPU profile")
+                else:
+                    # Capture profile data as string; the stats are sorted once
+                    # and reused for bottleneck detection
+                    import pstats
+                    stats_buf = self._stats_buf
+                    stats_buf.seek(0)
+                    stats_buf.truncate(0)
+                    profile_stats = pstats.Stats(profiler, stream=stats_buf).strip_dirs().sort_stats('cumulative')
+                    profile_stats.print_stats()
+                    profile_data = stats_buf.getvalue()
+        finally:
+            self._nodes_in_flight -= 1
+            if profiler:
+                profiler.disable()
+                self._profile_lock.release()
         
         # Get final memory snapshot
         final_memory = self._get_memory_snapshot()
         memory_growth = final_memory.current_memory_mb - initial_memory.current_memory_mb
         
-        # Get memory peak if available
-        memory_peak = 0
-        if self.enable_memory_tracking:
-            current, peak = tracemalloc.get_traced_memory()
-            memory_peak = peak / 1024 / 1024  # Convert to MB
-        
         # Analyze bottlenecks
         bottlenecks = self._analyze_bottlenecks(execution_time, final_memory, profile_stats)
         
+        function_calls = profile_stats.total_calls if profile_stats else 0
+        
+        # Generate optimization suggestions
+        optimization_suggestions = self._generate_optimization_suggestions(
+            execution_time, final_memory, memory_growth, function_calls, io_operations
+        )
+        
         # Create performance metrics
         metrics = PerformanceMetrics(
             node_name=node_name,
@@ -326,19 +488,16 @@ class NodeProfiler:
             memory_usage=final_memory,
             memory_peak=memory_peak,
             memory_growth=memory_growth,
-            function_calls=profile_stats.total_calls if profile_stats else 0,
-            io_operations=0,  # Simplified - would need more detailed tracking
+            function_calls=function_calls,
+            io_operations=io_operations,
             bottlenecks=bottlenecks,
-            optimization_suggestions=[],  # Will be filled below
+            optimization_suggestions=optimization_suggestions,
             profile_data=profile_data
         )
         
-        # Generate optimization suggestions
-        metrics.optimization_suggestions = self._generate_optimization_suggestions(metrics)
-        
         # Add to current session
-        self.current_session.metrics.append(metrics)
-        self.current_session.nodes_profiled.append(node_name)
+        session.metrics.append(metrics)
+        session.nodes_profiled.append(node_name)
         
         logger.info(f"Profiled {node_name}: {execution_time:.3f}s execution, "
                    f"{final_memory.current_memory_mb:.1f}MB memory, "
@@ -346,6 +505,23 @@ class NodeProfiler:
         
         return metrics
     
+    async def profile_nodes_concurrently(self, node_inputs: List[Tuple[str, ReviewState]]) -> List[PerformanceMetrics]:
+        """Profile independent node executions concurrently in the current session.
+        
+        Wall-clock time drops from the sum of the node times to roughly the
+        slowest node. tracemalloc and psutil figures are process-wide, so the
+        memory metrics of overlapping nodes include each other's allocations.
+        cProfile cannot separate interleaved coroutines, so nodes that overlap
+        get no CPU profile or profile-based bottlenecks.
+        """
+        if not self.current_session:
+            raise RuntimeError("No active profiling session. Call start_profiling_session() first.")
+        
+        results = await asyncio.gather(
+            *(self.profile_node_execution(node_name, state) for node_name, state in node_inputs)
+        )
+        return list(results)
+    
     def _generate_session_summary(self, session: ProfilingSession) -> Dict[str, Any]:
         """Generate comprehensive session summary."""
         if not session.metrics:
@@ -387,18 +563,20 @@ class NodeProfiler:
             return 100.0
         
         score = 100.0
+        t = self.thresholds
         
         for metric in metrics:
             # Deduct points for execution time
-            if metric.execution_time > self.thresholds["execution_time_critical"]:
+            if metric.execution_time > t["execution_time_critical"]:
                 score -= 20
-            elif metric.execution_time > self.thresholds["execution_time_warning"]:
+            elif metric.execution_time > t["execution_time_warning"]:
                 score -= 10
             
             # Deduct points for memory usage
-            if metric.memory_usage.current_memory_mb > self.thresholds["memory_usage_critical"]:
+            current_memory_mb = metric.memory_usage.current_memory_mb
+            if current_memory_mb > t["memory_usage_critical"]:
                 score -= 15
-            elif metric.memory_usage.current_memory_mb > self.thresholds["memory_usage_warning"]:
+            elif current_memory_mb > t["memory_usage_warning"]:
                 score -= 8
             
             # Deduct points for bottlenecks
@@ -406,39 +584,76 @@ class NodeProfiler:
         
         return max(0.0, score)
     
-    def save_profiling_report(self, session: ProfilingSession, filename: str = None) -> Path:
-        """Save comprehensive profiling report."""
+    def _build_report_data(self, session: ProfilingSession) -> Dict[str, Any]:
+        """Convert a session to a JSON-serializable report."""
+        report_data = {
+            "session_id": session.session_id,
+            "start_time": session.start_time,
+            "end_time": session.end_time,
+            "total_duration": session.total_duration,
+            "nodes_profiled": session.nodes_profiled,
+            "session_summary": session.session_summary,
+        }
+        
+        if msgspec is not None:
+            # msgspec encodes (slotted) dataclasses natively, no asdict copy needed
+            report_data["metrics"] = list(session.metrics)
+        else:
+            report_data["metrics"] = [asdict(metric) for metric in session.metrics]
+        
+        return report_data
+    
+    def _resolve_report_path(self, session: ProfilingSession, filename: Optional[str]) -> Tuple[Path, bool]:
+        """Resolve the report path; the flag is False when file output is disabled."""
         if not filename:
             filename = f"profiling_report_{session.session_id}.json"
 
         if self.profile_output_dir is None:
             logger.debug("Profiling directory not available, skipping file save")
             # Return a dummy path for compatibility
-            return Path(f"/tmp/{filename}")
+            return Path(f"/tmp/{filename}"), False
 
-        filepath = self.profile_output_dir / filename
+        return self.profile_output_dir / filename, True
+    
+    @staticmethod
+    def _write_report(filepath: Path, report_data: Dict[str, Any]):
+        """Serialize and write a report (blocking)."""
+        if _REPORT_ENCODER is not None:
+            payload = msgspec.json.format(_REPORT_ENCODER.encode(report_data), indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            return
+        
+        import json
+        with open(filepath, 'w') as f:
+            json.dump(report_data, f, indent=2, default=str)
+    
+    def save_profiling_report(self, session: ProfilingSession, filename: str = None) -> Path:
+        """Save comprehensive profiling report."""
+        filepath, writable = self._resolve_report_path(session, filename)
+        if not writable:
+            return filepath
         
         try:
-            # Convert session to serializable format
-            report_data = {
-                "session_id": session.session_id,
-                "start_time": session.start_time,
-                "end_time": session.end_time,
-                "total_duration": session.total_duration,
-                "nodes_profiled": session.nodes_profiled,
-                "session_summary": session.session_summary,
-                "metrics": []
-            }
+            self._write_report(filepath, self._build_report_data(session))
             
-            for metric in session.metrics:
-                metric_data = asdict(metric)
-                # Convert memory snapshot to dict
-                metric_data["memory_usage"] = asdict(metric.memory_usage)
-                report_data["metrics"].append(metric_data)
+            logger.info(f"Saved profiling report to {filepath}")
+            return filepath
             
-            import json
-            with open(filepath, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
+        except Exception as e:
+            logger.error(f"Failed to save profiling report: {e}", exc_info=True)
+            raise
+    
+    async def asave_profiling_report(self, session: ProfilingSession, filename: str = None) -> Path:
+        """Save comprehensive profiling report without blocking the event loop."""
+        filepath, writable = self._resolve_report_path(session, filename)
+        if not writable:
+            return filepath
+        
+        try:
+            report_data = self._build_report_data(session)
+            # Serialization and the file write run in the default executor
+            await asyncio.to_thread(self._write_report, filepath, report_data)
             
             logger.info(f"Saved profiling report to {filepath}")
             return filepath
@@ -448,48 +663,60 @@ class NodeProfiler:
             raise
     
     def print_performance_summary(self, session: ProfilingSession):
-        """Print formatted performance summary."""
-        print(f"\n{'='*60}")
-        print(f"PERFORMANCE PROFILING SUMMARY")
-        print(f"{'='*60}")
-        print(f"Session ID: {session.session_id}")
-        print(f"Duration: {session.total_duration:.3f}s")
-        print(f"Nodes Profiled: {session.session_summary['total_nodes']}")
-        print(f"Performance Score: {session.session_summary['performance_score']:.1f}/100")
-        
-        print(f"\nExecution Summary:")
-        print(f"  Total Execution Time: {session.session_summary['total_execution_time']:.3f}s")
-        print(f"  Average Execution Time: {session.session_summary['average_execution_time']:.3f}s")
-        print(f"  Max Memory Usage: {session.session_summary['max_memory_usage']:.1f}MB")
-        print(f"  Total Bottlenecks: {session.session_summary['total_bottlenecks']}")
-        
-        print(f"\nSlowest Node:")
-        slowest = session.session_summary['slowest_node']
-        print(f"  {slowest['name']}: {slowest['execution_time']:.3f}s")
-        
-        print(f"\nMemory Intensive Node:")
-        memory_node = session.session_summary['memory_intensive_node']
-        print(f"  {memory_node['name']}: {memory_node['memory_usage']:.1f}MB")
-        
-        print(f"\nDetailed Metrics:")
+        """Print formatted performance summary.
+        
+        When stdout is not a terminal (CI, redirected logs) only a one-line
+        log entry is emitted unless PROFILE_VERBOSE is set.
+        """
+        summary = session.session_summary
+        if not (sys.stdout.isatty() or os.getenv("PROFILE_VERBOSE")):
+            logger.info("Profiling session %s: score=%.1f",
+                        session.session_id, summary.get("performance_score", 100.0))
+            return
+        
+        lines = [
+            f"\n{'='*60}",
+            "PERFORMANCE PROFILING SUMMARY",
+            f"{'='*60}",
+            f"Session ID: {session.session_id}",
+            f"Duration: {session.total_duration:.3f}s",
+            f"Nodes Profiled: {summary['total_nodes']}",
+            f"Performance Score: {summary['performance_score']:.1f}/100",
+            "\nExecution Summary:",
+            f"  Total Execution Time: {summary['total_execution_time']:.3f}s",
+            f"  Average Execution Time: {summary['average_execution_time']:.3f}s",
+            f"  Max Memory Usage: {summary['max_memory_usage']:.1f}MB",
+            f"  Total Bottlenecks: {summary['total_bottlenecks']}",
+        ]
+        
+        slowest = summary['slowest_node']
+        lines.append("\nSlowest Node:")
+        lines.append(f"  {slowest['name']}: {slowest['execution_time']:.3f}s")
+        
+        memory_node = summary['memory_intensive_node']
+        lines.append("\nMemory Intensive Node:")
+        lines.append(f"  {memory_node['name']}: {memory_node['memory_usage']:.1f}MB")
+        
+        lines.append("\nDetailed Metrics:")
         for metric in session.metrics:
-            print(f"\n  {metric.node_name}:")
-            print(f"    Execution Time: {metric.execution_time:.3f}s")
-            print(f"    Memory Usage: {metric.memory_usage.current_memory_mb:.1f}MB")
-            print(f"    Memory Growth: {metric.memory_growth:.1f}MB")
-            print(f"    Function Calls: {metric.function_calls}")
+            lines.append(f"\n  {metric.node_name}:")
+            lines.append(f"    Execution Time: {metric.execution_time:.3f}s")
+            lines.append(f"    Memory Usage: {metric.memory_usage.current_memory_mb:.1f}MB")
+            lines.append(f"    Memory Growth: {metric.memory_growth:.1f}MB")
+            lines.append(f"    Function Calls: {metric.function_calls}")
             
             if metric.bottlenecks:
-                print(f"    Bottlenecks:")
-                for bottleneck in metric.bottlenecks:
-                    print(f"      - {bottleneck}")
+                lines.append("    Bottlenecks:")
+                lines.extend(f"      - {bottleneck}" for bottleneck in metric.bottlenecks)
             
             if metric.optimization_suggestions:
-                print(f"    Optimization Suggestions:")
-                for suggestion in metric.optimization_suggestions[:3]:  # Top 3
-                    print(f"      - {suggestion}")
+                lines.append("    Optimization Suggestions:")
+                lines.extend(f"      - {suggestion}"
+                             for suggestion in metric.optimization_suggestions[:3])  # Top 3
         
-        print(f"{'='*60}\n")
+        lines.append(f"{'='*60}\n")
+        # Emit the whole summary with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Global profiler instance
@@ -580,9 +807,11 @@ if __name__ == "__main__":
         session = profiler.end_profiling_session()
         
         print("\n4. Saving profiling report...")
-        report_path = profiler.save_profiling_report(session)
+        report_path = await profiler.asave_profiling_report(session)
         print(f"✅ Saved report to {report_path}")
         
+        profiler.stop_memory_tracking()
+        
         print("\n" + "=" * 50)
         print("Profiling system testing completed!")
     
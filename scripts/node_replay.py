@@ -10,21 +10,42 @@ Part of Milestone 2: Individual Node Testing & Workflow Debugging
 """
 
 import asyncio
+import base64
+import hashlib
+import itertools
 import json
+import struct
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Callable
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Deque, Mapping, Iterator, BinaryIO, Awaitable
+from dataclasses import dataclass, replace
 from enum import Enum
 import sys
 
+try:
+    import msgspec  # Optional: compact msgpack persistence for replay sequences
+except ImportError:
+    msgspec = None
+
+try:
+    import xxhash  # Optional: faster content hashing
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson  # Optional: faster JSON fallback format
+except ImportError:
+    orjson = None
+
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from state import ReviewState, ReviewStatus
 from nodes import start_review_node, analyze_code_node, generate_report_node, error_handler_node
-from scripts.node_serialization import NodeSerializer, SerializedData, get_serializer
+from scripts.node_serialization import NodeSerializer, SerializedData, get_serializer, _is_text_payload
 from scripts.node_tracing import NodeTracer, get_tracer, traced_node
 from logging_config import get_logger, initialize_logging, LoggingConfig
 
@@ -48,20 +69,27 @@ class ReplayMode(Enum):
     DEBUG = "debug"  # Debug mode with breakpoints
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplayStep:
     """Individual step in a replay sequence."""
     step_id: str
     node_name: str
     input_data: SerializedData
     expected_output: Optional[SerializedData]
-    timestamp: str
+    timestamp_ns: int  # time.time_ns() at creation
     execution_time: float
     success: bool
     error_message: Optional[str]
+    # When set, input_data holds only the fields that differ from this step's input
+    base_step_id: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> str:
+        """Creation time as an ISO-8601 string."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplaySequence:
     """Complete sequence of replay steps."""
     sequence_id: str
@@ -72,7 +100,7 @@ class ReplaySequence:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplayResult:
     """Result of a replay execution."""
     sequence_id: str
@@ -86,6 +114,95 @@ class ReplayResult:
     error_message: Optional[str]
 
 
+@dataclass(slots=True)
+class ReplayResultCompact:
+    """Lightweight replay record kept in the engine's history."""
+    step_id: str
+    node_name: str
+    success: bool
+    execution_time_ns: int
+    diff_count: int
+    actual_hash: Optional[str]
+
+
+# Long-lived msgpack encoder/decoders, reused across save/load calls; the
+# decoders build the ReplaySequence/ReplayStep dataclasses directly
+_ENCODER = msgspec.msgpack.Encoder() if msgspec is not None else None
+_DECODER = msgspec.msgpack.Decoder(ReplaySequence) if msgspec is not None else None
+_STEP_DECODER = msgspec.msgpack.Decoder(ReplayStep) if msgspec is not None else None
+
+# .mpk files are a sequence of frames: a 4-byte big-endian length followed by
+# a msgpack payload. The first frame is the sequence header (a ReplaySequence
+# with no steps), every following frame is one ReplayStep.
+_FRAME_LENGTH = struct.Struct(">I")
+
+
+# Maximum number of cached SerializedData entries per engine
+_SERIALIZE_CACHE_SIZE = 256
+
+# Maximum number of replay records kept in replay_history
+_REPLAY_HISTORY_SIZE = 1024
+
+# Delta steps recorded against one full step before the next recorded step is
+# stored in full again, bounding how far deltas drift from their base
+_DELTAS_PER_SNAPSHOT = 32
+
+# Expected outputs larger than this (serialized bytes) are compared in a
+# worker thread; below it the thread hand-off costs more than the comparison
+_COMPARE_OFFLOAD_BYTES = 64 * 1024
+
+
+def _encode_frame(obj: Any) -> bytearray:
+    """Encode obj as a length-prefixed msgpack frame."""
+    frame = bytearray(_FRAME_LENGTH.size)
+    _ENCODER.encode_into(obj, frame, _FRAME_LENGTH.size)
+    _FRAME_LENGTH.pack_into(frame, 0, len(frame) - _FRAME_LENGTH.size)
+    return frame
+
+
+def _iter_frames(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the payload of each length-prefixed frame in a binary file."""
+    while True:
+        prefix = f.read(_FRAME_LENGTH.size)
+        if not prefix:
+            return
+        if len(prefix) < _FRAME_LENGTH.size:
+            raise ValueError("Truncated frame header in replay file")
+        (length,) = _FRAME_LENGTH.unpack(prefix)
+        payload = f.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated frame payload in replay file")
+        yield payload
+
+
+def _payload_to_json(serialized: SerializedData) -> str:
+    """JSON-file form of a payload: the JSON text itself, or base64 for binary formats."""
+    if _is_text_payload(serialized.metadata):
+        return serialized.data.decode('utf-8')
+    return base64.b64encode(serialized.data).decode('ascii')
+
+
+def _payload_from_json(data: str, metadata) -> bytes:
+    """Payload bytes from their JSON-file form (see _payload_to_json)."""
+    if _is_text_payload(metadata):
+        return data.encode('utf-8')
+    return base64.b64decode(data)
+
+
+def _content_key(obj: Any) -> Optional[bytes]:
+    """Fast content hash of a state/output dict, or None if it can't be encoded."""
+    if _ENCODER is None:
+        return None
+    try:
+        blob = _ENCODER.encode(obj)
+    except (TypeError, ValueError):
+        # e.g. message objects msgspec doesn't know how to encode
+        return None
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(blob)
+    return hashlib.blake2b(blob, digest_size=8).digest()
+
+
 class NodeReplayEngine:
     """Advanced replay engine for node executions."""
     
@@ -93,15 +210,38 @@ class NodeReplayEngine:
         self.mode = mode
         self.serializer = get_serializer()
         self.tracer = get_tracer()
-        self.replay_history: List[ReplayResult] = []
-        
-        # Available nodes for replay
-        self.available_nodes = {
+        # Bounded history of compact records; full outputs are only returned
+        # from replay_step, never retained
+        self.replay_history: Deque[ReplayResultCompact] = deque(maxlen=_REPLAY_HISTORY_SIZE)
+        # Running totals over all replays so get_replay_summary is O(1)
+        self._total_replays = 0
+        self._successful_replays = 0
+        self._total_replay_time_ns = 0
+        self._total_differences = 0
+        self._nodes_replayed: Dict[str, None] = {}  # insertion-ordered set
+        # Content-addressed cache of serialized inputs/outputs, keyed by
+        # (node_name, data_type, content hash)
+        self._serialize_cache: Dict[Tuple[str, str, bytes], SerializedData] = {}
+        # Content hash of each deserialized expected output, keyed by the
+        # serialized data's checksum so it is only hashed once
+        self._expected_hash_cache: Dict[str, Optional[bytes]] = {}
+        # Recently recorded/loaded steps by id, used to resolve delta inputs
+        self._known_steps: Dict[str, ReplayStep] = {}
+        # Number of delta steps stored against each base step id; these bases
+        # are never evicted from _known_steps
+        self._delta_counts: Dict[str, int] = {}
+        
+        # Available nodes for replay (read-only)
+        self.available_nodes: Mapping[str, Callable] = MappingProxyType({
             "start_review_node": start_review_node,
             "analyze_code_node": analyze_code_node,
             "generate_report_node": generate_report_node,
             "error_handler_node": error_handler_node
-        }
+        })
+        # Per-node replay entry points with their dependencies pre-bound
+        self._compiled_nodes: Mapping[str, Callable[[SerializedData], Awaitable[Any]]] = MappingProxyType({
+            name: self._compile_node(func) for name, func in self.available_nodes.items()
+        })
         
         # Create replay directory
         self.replay_dir = Path("logs/replay/sequences")
@@ -120,58 +260,171 @@ class NodeReplayEngine:
                 # If even temp directory fails, disable file output
                 self.replay_dir = None
     
+    def _compile_node(self, node_func: Callable) -> Callable[[ReplayStep], Awaitable[Any]]:
+        """Bind input deserialization and a node into a single callable.
+        
+        The returned function deserializes the step input eagerly and returns
+        the node's coroutine unstarted, so timing only covers node execution.
+        """
+        materialize = self._materialize_input
+        
+        def prepare(step: ReplayStep) -> Awaitable[Any]:
+            return node_func(materialize(step))
+        
+        return prepare
+    
+    def _register_step(self, step: ReplayStep) -> None:
+        """Remember a step so later delta steps can be resolved against it."""
+        if step.step_id in self._known_steps:
+            self._known_steps[step.step_id] = step
+            return
+        if step.base_step_id is not None:
+            self._delta_counts[step.base_step_id] = self._delta_counts.get(step.base_step_id, 0) + 1
+        if len(self._known_steps) >= _REPLAY_HISTORY_SIZE:
+            # Evict the oldest step that no delta step depends on
+            for step_id in self._known_steps:
+                if step_id not in self._delta_counts:
+                    del self._known_steps[step_id]
+                    break
+        self._known_steps[step.step_id] = step
+    
+    def _raw_input(self, step: ReplayStep) -> Dict[str, Any]:
+        """Serialized-form input of a step, with any delta chain applied."""
+        chain = [step]
+        while chain[-1].base_step_id is not None:
+            base = self._known_steps.get(chain[-1].base_step_id)
+            if base is None:
+                raise ValueError(f"Base step {chain[-1].base_step_id} of {chain[-1].step_id} is not loaded")
+            if len(chain) > len(self._known_steps):
+                raise ValueError(f"Delta chain of {step.step_id} is cyclic")
+            chain.append(base)
+        data: Dict[str, Any] = {}
+        for link in reversed(chain):
+            data.update(self.serializer.deserialize_node_output(link.input_data))
+        return data
+    
+    def _delta_base(self, step: ReplayStep) -> Optional[ReplayStep]:
+        """Full step to store a delta against when recording after step.
+        
+        Deltas always point at a full step, so resolving one never walks a
+        chain. Returns None when the next step should be stored in full.
+        """
+        self._register_step(step)
+        while step.base_step_id is not None:
+            step = self._known_steps.get(step.base_step_id)
+            if step is None:
+                return None
+        if self._delta_counts.get(step.step_id, 0) >= _DELTAS_PER_SNAPSHOT:
+            return None
+        return step
+    
+    def _materialize_input(self, step: ReplayStep) -> ReviewState:
+        """Full input state of a step."""
+        if step.base_step_id is None:
+            return self.serializer.deserialize_node_input(step.input_data)
+        return self.serializer._restore_state_from_serialization(self._raw_input(step))
+    
+    def _input_delta(self, input_state: ReviewState, base_step: ReplayStep) -> Optional[Dict[str, Any]]:
+        """Fields of input_state that differ from base_step's input.
+        
+        Returns None when a delta can't express the change (removed fields).
+        """
+        base = self._raw_input(base_step)
+        prepared = self.serializer._prepare_state_for_serialization(input_state)
+        if not base.keys() <= prepared.keys():
+            return None
+        return {key: input_state[key] for key, value in prepared.items()
+                if key not in base or base[key] != value}
+    
     def create_replay_step(self, node_name: str, input_state: ReviewState,
-                          expected_output: Optional[Dict[str, Any]] = None) -> ReplayStep:
+                          expected_output: Optional[Dict[str, Any]] = None,
+                          base_step_id: Optional[str] = None) -> ReplayStep:
         """Create a replay step from current execution data."""
         logger.info(f"Creating replay step for {node_name}")
         
         # Serialize input
-        input_serialized = self.serializer.serialize_node_input(node_name, input_state)
+        input_serialized = self._serialize_cached(
+            node_name, "input", input_state, self.serializer.serialize_node_input
+        )
         
         # Serialize expected output if provided
         expected_serialized = None
         if expected_output:
-            expected_serialized = self.serializer.serialize_node_output(node_name, expected_output)
+            expected_serialized = self._serialize_cached(
+                node_name, "output", expected_output, self.serializer.serialize_node_output
+            )
         
+        now_ns = time.time_ns()
         step = ReplayStep(
-            step_id=f"{node_name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+            step_id=f"{node_name}_{now_ns:x}",
             node_name=node_name,
             input_data=input_serialized,
             expected_output=expected_serialized,
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=now_ns,
             execution_time=0.0,  # Will be filled during actual execution
             success=True,  # Will be updated during replay
-            error_message=None
+            error_message=None,
+            base_step_id=base_step_id
         )
         
         logger.info(f"Created replay step: {step.step_id}")
         return step
     
-    async def record_node_execution(self, node_name: str, input_state: ReviewState) -> ReplayStep:
-        """Record a node execution for later replay."""
+    def _serialize_cached(self, node_name: str, data_type: str, data: Dict[str, Any],
+                          serialize: Callable[[str, Dict[str, Any]], SerializedData]) -> SerializedData:
+        """Serialize data, reusing a previous result for identical content."""
+        digest = _content_key(data)
+        if digest is None:
+            return serialize(node_name, data)
+        
+        key = (node_name, data_type, digest)
+        cached = self._serialize_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        serialized = serialize(node_name, data)
+        if len(self._serialize_cache) >= _SERIALIZE_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._serialize_cache[next(iter(self._serialize_cache))]
+        self._serialize_cache[key] = serialized
+        return serialized
+    
+    async def record_node_execution(self, node_name: str, input_state: ReviewState,
+                                    base_step: Optional[ReplayStep] = None) -> ReplayStep:
+        """Record a node execution for later replay.
+        
+        If base_step is given, only the fields that changed relative to the
+        full step it derives from (base_step itself, or its base) are stored;
+        that step must be replayed alongside this one. Inputs with removed
+        fields, and every _DELTAS_PER_SNAPSHOT-th delta, are stored in full.
+        """
         logger.info(f"Recording execution of {node_name}")
         
-        if node_name not in self.available_nodes:
+        node_func = self.available_nodes.get(node_name)
+        if node_func is None:
             raise ValueError(f"Unknown node: {node_name}")
         
-        node_func = self.available_nodes[node_name]
-        
         # Execute node and measure time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             output = await node_func(input_state)
-            execution_time = time.time() - start_time
             success = True
             error_message = None
         except Exception as e:
             output = None
-            execution_time = time.time() - start_time
             success = False
             error_message = str(e)
             logger.error(f"Error during recording: {e}")
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Create replay step
-        step = self.create_replay_step(node_name, input_state, output)
+        base_step = self._delta_base(base_step) if base_step is not None else None
+        delta = self._input_delta(input_state, base_step) if base_step is not None else None
+        if delta is not None:
+            step = self.create_replay_step(node_name, delta, output, base_step_id=base_step.step_id)
+        else:
+            step = self.create_replay_step(node_name, input_state, output)
+        self._register_step(step)
         step.execution_time = execution_time
         step.success = success
         step.error_message = error_message
@@ -181,11 +434,12 @@ class NodeReplayEngine:
     
     def create_replay_sequence(self, name: str, description: str, steps: List[ReplayStep]) -> ReplaySequence:
         """Create a replay sequence from multiple steps."""
+        now = datetime.now()
         sequence = ReplaySequence(
-            sequence_id=f"seq_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+            sequence_id=f"seq_{now.strftime('%Y%m%d_%H%M%S_%f')}",
             name=name,
             description=description,
-            created_at=datetime.now().isoformat(),
+            created_at=now.isoformat(),
             steps=steps,
             metadata={
                 "total_steps": len(steps),
@@ -198,53 +452,38 @@ class NodeReplayEngine:
         return sequence
     
     def save_replay_sequence(self, sequence: ReplaySequence) -> Path:
-        """Save replay sequence to file."""
+        """Save replay sequence to file.
+        
+        Sequences are written as framed msgpack (.mpk) when msgspec is
+        available, otherwise as JSON.
+        """
+        suffix = ".mpk" if _ENCODER is not None else ".json"
+        filename = f"{sequence.name.replace(' ', '_')}_{sequence.sequence_id}{suffix}"
+
         if self.replay_dir is None:
             logger.debug("Replay directory not available, skipping file save")
             # Return a dummy path for compatibility
-            filename = f"{sequence.name.replace(' ', '_')}_{sequence.sequence_id}.json"
             return Path(f"/tmp/{filename}")
 
-        filename = f"{sequence.name.replace(' ', '_')}_{sequence.sequence_id}.json"
         filepath = self.replay_dir / filename
 
         try:
-            # Convert to serializable format
-            sequence_data = {
-                "sequence_id": sequence.sequence_id,
-                "name": sequence.name,
-                "description": sequence.description,
-                "created_at": sequence.created_at,
-                "metadata": sequence.metadata,
-                "steps": []
-            }
-            
-            for step in sequence.steps:
-                step_data = {
-                    "step_id": step.step_id,
-                    "node_name": step.node_name,
-                    "timestamp": step.timestamp,
-                    "execution_time": step.execution_time,
-                    "success": step.success,
-                    "error_message": step.error_message,
-                    "input_data": {
-                        "data": step.input_data.data,
-                        "metadata": asdict(step.input_data.metadata),
-                        "schema_version": step.input_data.schema_version
-                    }
-                }
-                
-                if step.expected_output:
-                    step_data["expected_output"] = {
-                        "data": step.expected_output.data,
-                        "metadata": asdict(step.expected_output.metadata),
-                        "schema_version": step.expected_output.schema_version
-                    }
-                
-                sequence_data["steps"].append(step_data)
-            
-            with open(filepath, 'w') as f:
-                json.dump(sequence_data, f, indent=2, default=str)
+            if _ENCODER is not None:
+                # msgspec encodes the dataclasses (and enum values) natively;
+                # steps are framed one by one so the file can be streamed
+                with open(filepath, 'wb') as f:
+                    f.write(_encode_frame(replace(sequence, steps=[])))
+                    for step in sequence.steps:
+                        f.write(_encode_frame(step))
+            elif orjson is not None:
+                # Built as a dict rather than dumping the dataclasses: JSON has
+                # no bytes type, so payloads need _payload_to_json
+                filepath.write_bytes(orjson.dumps(
+                    self._sequence_to_dict(sequence), option=orjson.OPT_INDENT_2, default=str
+                ))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(self._sequence_to_dict(sequence), f, indent=2, default=str)
             
             logger.info(f"Saved replay sequence to {filepath}")
             return filepath
@@ -253,99 +492,202 @@ class NodeReplayEngine:
             logger.error(f"Failed to save replay sequence: {e}", exc_info=True)
             raise
     
+    async def asave_replay_sequence(self, sequence: ReplaySequence) -> Path:
+        """Save replay sequence to file without blocking the event loop.
+        
+        Encoding and the file write run in a worker thread; the sequence must
+        not be modified until the save completes.
+        """
+        return await asyncio.to_thread(self.save_replay_sequence, sequence)
+    
+    def append_replay_step(self, filepath: Union[str, Path], step: ReplayStep) -> None:
+        """Append a step to a saved .mpk sequence without rewriting it."""
+        if _ENCODER is None:
+            raise RuntimeError("msgspec is required to append to msgpack replay sequences")
+        with open(filepath, 'ab') as f:
+            f.write(_encode_frame(step))
+    
+    def iter_replay_steps(self, filepath: Union[str, Path]) -> Iterator[ReplayStep]:
+        """Stream the steps of a saved .mpk sequence one at a time."""
+        if _STEP_DECODER is None:
+            raise RuntimeError("msgspec is required to load msgpack replay sequences")
+        with open(filepath, 'rb') as f:
+            frames = _iter_frames(f)
+            next(frames, None)  # skip the sequence header
+            for payload in frames:
+                step = _STEP_DECODER.decode(payload)
+                self._register_step(step)
+                yield step
+    
     def load_replay_sequence(self, filepath: Union[str, Path]) -> ReplaySequence:
-        """Load replay sequence from file."""
+        """Load replay sequence from a .mpk (msgpack) or .json file."""
         filepath = Path(filepath)
         
         try:
-            with open(filepath, 'r') as f:
-                sequence_data = json.load(f)
-            
-            # Reconstruct steps
-            steps = []
-            for step_data in sequence_data["steps"]:
-                # Reconstruct input data
-                input_metadata = step_data["input_data"]["metadata"]
-                input_metadata["format"] = input_metadata["format"]  # Already a string from JSON
-                
-                input_serialized = SerializedData(
-                    data=step_data["input_data"]["data"],
-                    metadata=self.serializer._create_metadata_from_dict(input_metadata),
-                    schema_version=step_data["input_data"]["schema_version"]
-                )
-                
-                # Reconstruct expected output if present
-                expected_serialized = None
-                if "expected_output" in step_data:
-                    output_metadata = step_data["expected_output"]["metadata"]
-                    expected_serialized = SerializedData(
-                        data=step_data["expected_output"]["data"],
-                        metadata=self.serializer._create_metadata_from_dict(output_metadata),
-                        schema_version=step_data["expected_output"]["schema_version"]
-                    )
-                
-                step = ReplayStep(
-                    step_id=step_data["step_id"],
-                    node_name=step_data["node_name"],
-                    input_data=input_serialized,
-                    expected_output=expected_serialized,
-                    timestamp=step_data["timestamp"],
-                    execution_time=step_data["execution_time"],
-                    success=step_data["success"],
-                    error_message=step_data.get("error_message")
-                )
-                
-                steps.append(step)
+            if filepath.suffix == ".mpk":
+                if _DECODER is None:
+                    raise RuntimeError("msgspec is required to load msgpack replay sequences")
+                with open(filepath, 'rb') as f:
+                    frames = _iter_frames(f)
+                    header = next(frames, None)
+                    if header is None:
+                        raise ValueError(f"Empty replay file: {filepath}")
+                    sequence = _DECODER.decode(header)
+                    sequence.steps = [_STEP_DECODER.decode(payload) for payload in frames]
+            else:
+                if orjson is not None:
+                    sequence_data = orjson.loads(filepath.read_bytes())
+                else:
+                    with open(filepath, 'r') as f:
+                        sequence_data = json.load(f)
+                sequence = self._sequence_from_dict(sequence_data)
             
-            sequence = ReplaySequence(
-                sequence_id=sequence_data["sequence_id"],
-                name=sequence_data["name"],
-                description=sequence_data["description"],
-                created_at=sequence_data["created_at"],
-                steps=steps,
-                metadata=sequence_data["metadata"]
-            )
-            
-            logger.info(f"Loaded replay sequence: {sequence.sequence_id} with {len(steps)} steps")
+            for step in sequence.steps:
+                self._register_step(step)
+            logger.info(f"Loaded replay sequence: {sequence.sequence_id} with {len(sequence.steps)} steps")
             return sequence
             
         except Exception as e:
             logger.error(f"Failed to load replay sequence: {e}", exc_info=True)
             raise
     
+    def _sequence_to_dict(self, sequence: ReplaySequence) -> Dict[str, Any]:
+        """Convert a replay sequence to a JSON-serializable dict."""
+        sequence_data = {
+            "sequence_id": sequence.sequence_id,
+            "name": sequence.name,
+            "description": sequence.description,
+            "created_at": sequence.created_at,
+            "metadata": sequence.metadata,
+            "steps": []
+        }
+        
+        for step in sequence.steps:
+            step_data = {
+                "step_id": step.step_id,
+                "node_name": step.node_name,
+                "timestamp_ns": step.timestamp_ns,
+                "timestamp": step.timestamp,
+                "execution_time": step.execution_time,
+                "success": step.success,
+                "error_message": step.error_message,
+                "base_step_id": step.base_step_id,
+                "input_data": {
+                    "data": _payload_to_json(step.input_data),
+                    "metadata": step.input_data.metadata.to_dict(),
+                    "schema_version": step.input_data.schema_version
+                }
+            }
+            
+            if step.expected_output:
+                step_data["expected_output"] = {
+                    "data": _payload_to_json(step.expected_output),
+                    "metadata": step.expected_output.metadata.to_dict(),
+                    "schema_version": step.expected_output.schema_version
+                }
+            
+            sequence_data["steps"].append(step_data)
+        
+        return sequence_data
+    
+    def _sequence_from_dict(self, sequence_data: Dict[str, Any]) -> ReplaySequence:
+        """Reconstruct a replay sequence from its decoded JSON form."""
+        # Reconstruct steps
+        steps = []
+        for step_data in sequence_data["steps"]:
+            # Reconstruct input data
+            input_metadata = self.serializer._create_metadata_from_dict(step_data["input_data"]["metadata"])
+            input_serialized = SerializedData(
+                data=_payload_from_json(step_data["input_data"]["data"], input_metadata),
+                metadata=input_metadata,
+                schema_version=step_data["input_data"]["schema_version"]
+            )
+            
+            # Reconstruct expected output if present
+            expected_serialized = None
+            if step_data.get("expected_output"):
+                output_metadata = self.serializer._create_metadata_from_dict(step_data["expected_output"]["metadata"])
+                expected_serialized = SerializedData(
+                    data=_payload_from_json(step_data["expected_output"]["data"], output_metadata),
+                    metadata=output_metadata,
+                    schema_version=step_data["expected_output"]["schema_version"]
+                )
+            
+            step = ReplayStep(
+                step_id=step_data["step_id"],
+                node_name=step_data["node_name"],
+                input_data=input_serialized,
+                expected_output=expected_serialized,
+                timestamp_ns=self._step_timestamp_ns(step_data),
+                execution_time=step_data["execution_time"],
+                success=step_data["success"],
+                error_message=step_data.get("error_message"),
+                base_step_id=step_data.get("base_step_id")
+            )
+            
+            steps.append(step)
+        
+        return ReplaySequence(
+            sequence_id=sequence_data["sequence_id"],
+            name=sequence_data["name"],
+            description=sequence_data["description"],
+            created_at=sequence_data["created_at"],
+            steps=steps,
+            metadata=sequence_data["metadata"]
+        )
+    
+    @staticmethod
+    def _step_timestamp_ns(step_data: Dict[str, Any]) -> int:
+        """Read a step's creation time, accepting files that only carry the ISO string."""
+        if "timestamp_ns" in step_data:
+            return step_data["timestamp_ns"]
+        return int(datetime.fromisoformat(step_data["timestamp"]).timestamp() * 1_000_000) * 1000
+    
     async def replay_step(self, step: ReplayStep) -> ReplayResult:
         """Replay a single step."""
         logger.info(f"Replaying step: {step.step_id} ({step.node_name})")
         
-        if step.node_name not in self.available_nodes:
+        prepare = self._compiled_nodes.get(step.node_name)
+        if prepare is None:
             raise ValueError(f"Unknown node: {step.node_name}")
         
-        node_func = self.available_nodes[step.node_name]
-        
-        # Deserialize input
-        input_state = self.serializer.deserialize_node_input(step.input_data)
-        
-        # Execute node
-        start_time = time.time()
+        # Execute node; a step whose input can't be deserialized fails like
+        # one whose node raises
+        actual_output = None
+        execution_time_ns = 0
         try:
-            actual_output = await node_func(input_state)
-            execution_time = time.time() - start_time
+            # Deserialize input; the node itself only starts running when awaited
+            pending = prepare(step)
+            start_ns = time.perf_counter_ns()
+            try:
+                actual_output = await pending
+            finally:
+                execution_time_ns = time.perf_counter_ns() - start_ns
             success = True
             error_message = None
         except Exception as e:
-            actual_output = None
-            execution_time = time.time() - start_time
             success = False
             error_message = str(e)
             logger.error(f"Error during replay: {e}")
+        execution_time = execution_time_ns / 1e9
         
         # Compare with expected output if available
         expected_output = None
         differences = []
+        actual_key = _content_key(actual_output)
         
         if step.expected_output:
             expected_output = self.serializer.deserialize_node_output(step.expected_output)
-            differences = self._compare_outputs(actual_output, expected_output)
+            checksum = step.expected_output.metadata.checksum
+            if checksum not in self._expected_hash_cache:
+                if len(self._expected_hash_cache) >= _SERIALIZE_CACHE_SIZE:
+                    del self._expected_hash_cache[next(iter(self._expected_hash_cache))]
+                self._expected_hash_cache[checksum] = _content_key(expected_output)
+            compare_args = (actual_output, expected_output, self._expected_hash_cache[checksum], actual_key)
+            if step.expected_output.metadata.original_size > _COMPARE_OFFLOAD_BYTES:
+                differences = await asyncio.to_thread(self._compare_outputs, *compare_args)
+            else:
+                differences = self._compare_outputs(*compare_args)
         
         result = ReplayResult(
             sequence_id="",  # Will be set by sequence replay
@@ -359,17 +701,73 @@ class NodeReplayEngine:
             error_message=error_message
         )
         
-        self.replay_history.append(result)
+        self.replay_history.append(ReplayResultCompact(
+            step_id=step.step_id,
+            node_name=step.node_name,
+            success=success,
+            execution_time_ns=execution_time_ns,
+            diff_count=len(differences),
+            actual_hash=actual_key.hex() if actual_key is not None else None
+        ))
+        self._total_replays += 1
+        self._successful_replays += int(success)
+        self._total_replay_time_ns += execution_time_ns
+        self._total_differences += len(differences)
+        self._nodes_replayed[step.node_name] = None
         
         logger.info(f"Replayed step {step.step_id}: Success={success}, "
                    f"Time={execution_time:.3f}s, Differences={len(differences)}")
         
         return result
     
-    async def replay_sequence(self, sequence: ReplaySequence) -> List[ReplayResult]:
-        """Replay an entire sequence."""
+    async def _replay_sequence_step(self, sequence: ReplaySequence, step: ReplayStep) -> ReplayResult:
+        """Replay one step of sequence, turning an exception into a failed result.
+        
+        A step that raises (e.g. an unknown node) is reported like a step whose
+        node failed instead of abandoning the rest of the replay.
+        """
+        try:
+            result = await self.replay_step(step)
+        except Exception as e:
+            logger.error(f"Error during replay of {step.step_id}: {e}")
+            result = ReplayResult(
+                sequence_id="",
+                step_id=step.step_id,
+                node_name=step.node_name,
+                success=False,
+                actual_output=None,
+                expected_output=None,
+                execution_time=0.0,
+                differences=[],
+                error_message=str(e)
+            )
+        result.sequence_id = sequence.sequence_id
+        return result
+    
+    async def replay_sequence(self, sequence: ReplaySequence, concurrency: int = 1) -> List[ReplayResult]:
+        """Replay an entire sequence.
+        
+        In FAST mode steps are independent (each replays its own recorded
+        input), so up to ``concurrency`` of them may run at once. Replayed
+        nodes are real workflow nodes with side effects, so this is opt-in;
+        the other modes always replay strictly in order. In every mode a step
+        that raises becomes a failed result.
+        """
         logger.info(f"Replaying sequence: {sequence.sequence_id} ({sequence.name})")
         
+        if self.mode == ReplayMode.FAST:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            
+            async def run(step: ReplayStep) -> ReplayResult:
+                async with semaphore:
+                    return await self._replay_sequence_step(sequence, step)
+            
+            results = await asyncio.gather(*(run(step) for step in sequence.steps))
+            
+            logger.info(f"Completed replay of sequence {sequence.sequence_id}: "
+                       f"{len(results)} steps executed")
+            return results
+        
         results = []
         
         for i, step in enumerate(sequence.steps):
@@ -382,8 +780,7 @@ class NodeReplayEngine:
                 # Wait for original execution time (simplified)
                 await asyncio.sleep(min(step.execution_time, 0.1))
             
-            result = await self.replay_step(step)
-            result.sequence_id = sequence.sequence_id
+            result = await self._replay_sequence_step(sequence, step)
             results.append(result)
             
             # Stop on error if in debug mode
@@ -396,15 +793,37 @@ class NodeReplayEngine:
         
         return results
     
-    def _compare_outputs(self, actual: Any, expected: Any) -> List[str]:
-        """Compare actual and expected outputs."""
+    def _compare_outputs(self, actual: Any, expected: Any,
+                         expected_key: Optional[bytes] = None,
+                         actual_key: Optional[bytes] = None) -> List[str]:
+        """Compare actual and expected outputs.
+        
+        Outputs whose msgpack encodings hash identically are treated as equal
+        without a per-key walk; nested values are compared by encoded content,
+        so e.g. an enum matches its serialized value.
+        """
         differences = []
         
-        if type(actual) != type(expected):
+        if type(actual) is not type(expected):
             differences.append(f"Type mismatch: {type(actual)} vs {type(expected)}")
             return differences
         
-        if isinstance(actual, dict) and isinstance(expected, dict):
+        # Hash-first fast path for the common identical-output case
+        if actual_key is None:
+            actual_key = _content_key(actual)
+        if actual_key is not None:
+            if expected_key is None:
+                expected_key = _content_key(expected)
+            if actual_key == expected_key:
+                return differences
+        
+        # Both sides have the same type at this point
+        if isinstance(actual, dict):
+            # C-level dict equality bails out on the first mismatch; only
+            # walk the keys when there is a difference to report
+            if actual == expected:
+                return differences
+            
             # Compare dictionary keys
             actual_keys = set(actual.keys())
             expected_keys = set(expected.keys())
@@ -429,29 +848,28 @@ class NodeReplayEngine:
     
     def get_replay_summary(self) -> Dict[str, Any]:
         """Get summary of replay operations."""
-        if not self.replay_history:
+        total = self._total_replays
+        if not total:
             return {"total_replays": 0}
         
-        successful = [r for r in self.replay_history if r.success]
-        failed = [r for r in self.replay_history if not r.success]
-        
+        successful = self._successful_replays
         return {
-            "total_replays": len(self.replay_history),
-            "successful": len(successful),
-            "failed": len(failed),
-            "success_rate": len(successful) / len(self.replay_history) * 100,
-            "average_execution_time": sum(r.execution_time for r in self.replay_history) / len(self.replay_history),
-            "nodes_replayed": list(set(r.node_name for r in self.replay_history)),
-            "total_differences": sum(len(r.differences) for r in self.replay_history),
+            "total_replays": total,
+            "successful": successful,
+            "failed": total - successful,
+            "success_rate": successful / total * 100,
+            "average_execution_time": self._total_replay_time_ns / total / 1e9,
+            "nodes_replayed": list(self._nodes_replayed),
+            "total_differences": self._total_differences,
             "recent_replays": [
                 {
                     "step_id": r.step_id,
                     "node_name": r.node_name,
                     "success": r.success,
-                    "execution_time": r.execution_time,
-                    "differences": len(r.differences)
+                    "execution_time": r.execution_time_ns / 1e9,
+                    "differences": r.diff_count
                 }
-                for r in self.replay_history[-5:]
+                for r in itertools.islice(self.replay_history, max(0, len(self.replay_history) - 5), None)
             ]
         }
 
@@ -513,7 +931,7 @@ if __name__ == "__main__":
         })
         
         # Record analyze_code_node
-        step2 = await replay_engine.record_node_execution("analyze_code_node", updated_state)
+        step2 = await replay_engine.record_node_execution("analyze_code_node", updated_state, base_step=step1)
         steps.append(step2)
         
         print(f"✅ Recorded {len(steps)} execution steps")
@@ -528,7 +946,7 @@ if __name__ == "__main__":
         )
         
         # Save sequence
-        filepath = replay_engine.save_replay_sequence(sequence)
+        filepath = await replay_engine.asave_replay_sequence(sequence)
         print(f"✅ Saved replay sequence to {filepath}")
         
         print("\n3. Loading and replaying sequence...")
@@ -10,16 +10,43 @@ Part of Milestone 2: Individual Node Testing & Workflow Debugging
 """
 
 import json
+import mmap
+import os
 import pickle
 import base64
 import gzip
 import hashlib
+import itertools
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
-from dataclasses import dataclass, asdict
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable, Deque
+from dataclasses import dataclass
 from enum import Enum
 import sys
+import threading
+import time
+
+try:
+    import orjson  # Optional: C-speed JSON for node inputs/outputs
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard  # Optional: ZSTD_JSON format
+except ImportError:
+    zstandard = None
+
+try:
+    import msgspec  # Optional: MSGPACK format
+except ImportError:
+    msgspec = None
+
+try:
+    from blake3 import blake3  # Optional: faster payload checksums
+except ImportError:
+    blake3 = None
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -38,15 +65,138 @@ initialize_logging(LoggingConfig(
 
 logger = get_logger(__name__)
 
+# orjson options for node I/O: deterministic key order (checksums depend on
+# it) and int/enum dict keys, which the stdlib json module also accepts
+_ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+# Checksum algorithm for new payloads; recorded in the metadata so payloads
+# hashed with another algorithm can still be verified
+_CHECKSUM_ALGO = "blake3" if blake3 is not None else "sha256"
+_CHECKSUM_HASHERS = {"sha256": hashlib.sha256}
+if blake3 is not None:
+    _CHECKSUM_HASHERS["blake3"] = blake3
+
+# Pickle protocol for the PICKLE format (protocol 5 is available from Python 3.8)
+_PICKLE_PROTOCOL = 5
+
+# zstd level for ZSTD_JSON: gzip-like ratio at a fraction of the CPU
+_ZSTD_LEVEL = 3
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for _now_isoformat
+_clock_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_isoformat() -> str:
+    """Local time in datetime.isoformat() layout, reformatting only once per second."""
+    global _clock_cache
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _clock_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _clock_cache = (seconds, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for objects JSON doesn't handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    elif hasattr(obj, 'isoformat'):  # datetime objects
+        return obj.isoformat()
+    elif isinstance(obj, (set, frozenset)):
+        return list(obj)
+    elif isinstance(obj, bytes):
+        return base64.b64encode(obj).decode('utf-8')
+    elif hasattr(obj, '__dict__'):
+        return obj.__dict__
+    else:
+        return str(obj)
+
+
+# Shared msgpack codec for the MSGPACK format; unknown types go through the
+# same fallback as JSON
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=_json_default) if msgspec is not None else None
+_MSGPACK_DECODER = msgspec.msgpack.Decoder() if msgspec is not None else None
+
+
+def _prep_status(value: Any) -> Any:
+    if not value:
+        return value
+    return value.value if hasattr(value, 'value') else str(value)
+
+
+def _prep_messages(value: Any) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": type(msg).__name__,
+            "content": str(msg),
+            "additional_kwargs": getattr(msg, 'additional_kwargs', {}),
+            "response_metadata": getattr(msg, 'response_metadata', {})
+        }
+        for msg in (value or [])
+    ]
+
+
+def _prep_datetime(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# Per-key conversions applied by _prepare_state_for_serialization. Every
+# other ReviewState field is JSON-ready by its declared type, so only keys
+# outside the schema still need the generic datetime check
+_PREP_HANDLERS = {
+    "status": _prep_status,
+    "messages": _prep_messages,
+    "start_time": _prep_datetime,
+    "end_time": _prep_datetime,
+}
+_REVIEW_STATE_KEYS = frozenset(ReviewState.__annotations__)
+
+# Fallbacks for ReviewState fields missing from a payload; mutable defaults
+# are given as factories so every restored state gets its own container
+_REVIEW_STATE_DEFAULTS: Tuple[Tuple[str, Any], ...] = (
+    ("messages", list),
+    ("current_step", "initializing"),
+    ("status", ReviewStatus.INITIALIZING),
+    ("error_message", None),
+    ("repository_url", ""),
+    ("repository_info", None),
+    ("repository_type", None),
+    ("enabled_tools", list),
+    ("tool_results", dict),
+    ("failed_tools", list),
+    ("analysis_results", None),
+    ("files_analyzed", list),
+    ("total_files", 0),
+    ("review_config", dict),
+    ("start_time", None),
+    ("end_time", None),
+    ("notifications_sent", list),
+    ("report_generated", False),
+    ("final_report", None),
+)
+
 
 class SerializationFormat(Enum):
     """Supported serialization formats."""
     JSON = "json"
     PICKLE = "pickle"
-    COMPRESSED_JSON = "compressed_json"
+    COMPRESSED_JSON = "compressed_json"  # gzip
+    ZSTD_JSON = "zstd_json"
+    MSGPACK = "msgpack"
     BINARY = "binary"
 
 
+# Value -> member lookups used when restoring saved data
+_FORMAT_BY_VALUE = {f.value: f for f in SerializationFormat}
+_STATUS_BY_VALUE = {s.value: s for s in ReviewStatus}
+
+# Formats whose payload is compressed JSON (stored uncompressed below
+# compress_threshold)
+_COMPRESSED_FORMATS = frozenset({SerializationFormat.COMPRESSED_JSON, SerializationFormat.ZSTD_JSON})
+
+
 @dataclass
 class SerializationMetadata:
     """Metadata for serialized data."""
@@ -58,26 +208,101 @@ class SerializationMetadata:
     compressed_size: Optional[int]
     node_name: Optional[str]
     data_type: str  # 'input', 'output', 'state'
+    dict_id: Optional[int] = None  # zstd dictionary used for ZSTD_JSON, if any
+    compressed: bool = True  # False if a compressed format stored its JSON as-is
+    checksum_algo: str = "sha256"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat JSON-ready dict of the metadata fields."""
+        return {
+            "format": self.format.value,
+            "timestamp": self.timestamp,
+            "version": self.version,
+            "checksum": self.checksum,
+            "original_size": self.original_size,
+            "compressed_size": self.compressed_size,
+            "node_name": self.node_name,
+            "data_type": self.data_type,
+            "dict_id": self.dict_id,
+            "compressed": self.compressed,
+            "checksum_algo": self.checksum_algo
+        }
 
 
 @dataclass
 class SerializedData:
     """Container for serialized data with metadata."""
-    data: Union[str, bytes]
+    data: bytes  # Payload exactly as stored: UTF-8 JSON, or the binary encoding
     metadata: SerializationMetadata
     schema_version: str = "1.0"
 
 
+class LazySerializedState(Mapping):
+    """Read-only state mapping whose payload is decoded on first access."""
+    
+    def __init__(self, loader: Callable[[], Dict[str, Any]]):
+        self._loader = loader
+        self._data: Optional[Dict[str, Any]] = None
+    
+    def _materialize(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._loader()
+            self._loader = None
+        return self._data
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not None
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._materialize()[key]
+    
+    def __iter__(self):
+        return iter(self._materialize())
+    
+    def __len__(self) -> int:
+        return len(self._materialize())
+    
+    def to_dict(self) -> ReviewState:
+        """Fully decoded state as a regular (mutable) dict."""
+        return dict(self._materialize())
+
+
+def _is_text_payload(metadata: SerializationMetadata) -> bool:
+    """Whether SerializedData.data holds plain UTF-8 JSON rather than binary data."""
+    return (metadata.format == SerializationFormat.JSON
+            or (metadata.format in _COMPRESSED_FORMATS and not metadata.compressed))
+
+
 class NodeSerializer:
     """Advanced serialization utility for node inputs and outputs."""
     
     def __init__(self, default_format: SerializationFormat = SerializationFormat.JSON,
                  compression_enabled: bool = True,
-                 validation_enabled: bool = True):
+                 validation_enabled: bool = True,
+                 compress_threshold: int = 1024,
+                 history_limit: int = 10_000):
         self.default_format = default_format
         self.compression_enabled = compression_enabled
+        # Compressed formats store payloads smaller than this uncompressed:
+        # below ~1 KB compression overhead outweighs the savings
+        self.compress_threshold = compress_threshold
         self.validation_enabled = validation_enabled
-        self.serialization_history: List[Dict[str, Any]] = []
+        # Most recent serializations; the running totals below cover all of them
+        self.serialization_history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        # Running totals so get_serialization_summary doesn't rescan history
+        self._count_by_type: Dict[str, int] = {"input": 0, "output": 0}
+        self._count_by_format: Dict[str, int] = {format.value: 0 for format in SerializationFormat}
+        self._total_size = 0
+        # Guards the history and running totals; serializations may run in
+        # worker threads (e.g. asyncio.to_thread) on a shared serializer
+        self._stats_lock = threading.Lock()
+        # Trained zstd dictionary for small ZSTD_JSON payloads, loaded lazily
+        # from serialization_dir on first use
+        self._zstd_dict: Optional["zstandard.ZstdCompressionDict"] = None
+        self._zstd_dict_loaded = False
+        # Per-thread zstd contexts, reused across calls
+        self._zstd_local = threading.local()
         
         # Create serialization directory
         self.serialization_dir = Path("logs/serialization/data")
@@ -96,44 +321,152 @@ class NodeSerializer:
                 # If even temp directory fails, disable file output
                 self.serialization_dir = None
     
-    def _calculate_checksum(self, data: bytes) -> str:
-        """Calculate SHA-256 checksum for data integrity."""
-        return hashlib.sha256(data).hexdigest()
+    def _calculate_checksum(self, *chunks: bytes, algo: str = _CHECKSUM_ALGO) -> str:
+        """Calculate a checksum over one or more byte chunks for data integrity."""
+        hasher = _CHECKSUM_HASHERS[algo]()
+        for chunk in chunks:
+            hasher.update(chunk)
+        return hasher.hexdigest()
     
-    def _compress_data(self, data: bytes) -> bytes:
-        """Compress data using gzip."""
-        return gzip.compress(data)
+    def verify_checksum(self, serialized_data: SerializedData) -> bool:
+        """Check a payload against its recorded checksum."""
+        metadata = serialized_data.metadata
+        return self._calculate_checksum(serialized_data.data, algo=metadata.checksum_algo) == metadata.checksum
     
-    def _decompress_data(self, data: bytes) -> bytes:
-        """Decompress gzip data."""
+    def _compress_data(self, data: bytes,
+                       format: SerializationFormat = SerializationFormat.COMPRESSED_JSON) -> Tuple[bytes, Optional[int]]:
+        """Compress data with zstd for ZSTD_JSON, gzip otherwise.
+        
+        Returns the compressed bytes and the id of the zstd dictionary used.
+        """
+        if format == SerializationFormat.ZSTD_JSON:
+            zstd_dict = self._get_zstd_dict()
+            compressor, _ = self._zstd_contexts(zstd_dict)
+            return compressor.compress(data), zstd_dict.dict_id() if zstd_dict is not None else None
+        return gzip.compress(data), None
+    
+    def _decompress_data(self, data: bytes,
+                         format: SerializationFormat = SerializationFormat.COMPRESSED_JSON,
+                         dict_id: Optional[int] = None) -> bytes:
+        """Decompress zstd (ZSTD_JSON) or gzip data."""
+        if format == SerializationFormat.ZSTD_JSON:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd_json data")
+            zstd_dict = None
+            if dict_id is not None:
+                zstd_dict = self._get_zstd_dict()
+                if zstd_dict is None or zstd_dict.dict_id() != dict_id:
+                    raise ValueError(f"zstd dictionary {dict_id} is not available")
+            _, decompressor = self._zstd_contexts(zstd_dict)
+            return decompressor.decompress(data)
         return gzip.decompress(data)
     
-    def _serialize_to_json(self, obj: Any) -> str:
-        """Serialize object to JSON with custom handling."""
-        def json_serializer(obj):
-            """Custom JSON serializer for complex objects."""
-            if hasattr(obj, '__dict__'):
-                return obj.__dict__
-            elif isinstance(obj, Enum):
-                return obj.value
-            elif hasattr(obj, 'isoformat'):  # datetime objects
-                return obj.isoformat()
-            elif isinstance(obj, (set, frozenset)):
-                return list(obj)
-            elif isinstance(obj, bytes):
-                return base64.b64encode(obj).decode('utf-8')
-            else:
-                return str(obj)
+    def _zstd_contexts(self, zstd_dict: Optional["zstandard.ZstdCompressionDict"] = None):
+        """Compressor/decompressor pair for the calling thread.
         
-        return json.dumps(obj, default=json_serializer, indent=2, sort_keys=True)
+        zstd contexts hold per-operation state and must not be used from two
+        threads at once, so each thread builds its pair once and reuses it.
+        """
+        contexts = getattr(self._zstd_local, "contexts", None)
+        if contexts is None:
+            contexts = self._zstd_local.contexts = {}
+        key = zstd_dict.dict_id() if zstd_dict is not None else None
+        pair = contexts.get(key)
+        if pair is None:
+            pair = contexts[key] = (
+                zstandard.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=zstd_dict),
+                zstandard.ZstdDecompressor(dict_data=zstd_dict)
+            )
+        return pair
+    
+    def _should_compress(self, size: int, format: SerializationFormat) -> bool:
+        """Whether a payload of this size is worth compressing."""
+        if size >= self.compress_threshold:
+            return True
+        # A trained dictionary makes even small zstd payloads shrink
+        return format == SerializationFormat.ZSTD_JSON and self._get_zstd_dict() is not None
+    
+    @property
+    def _zstd_dict_path(self) -> Optional[Path]:
+        return self.serialization_dir / "zstd_dict.bin" if self.serialization_dir is not None else None
+    
+    def _get_zstd_dict(self) -> Optional["zstandard.ZstdCompressionDict"]:
+        """Return the trained zstd dictionary, loading it from disk once."""
+        if not self._zstd_dict_loaded:
+            self._zstd_dict_loaded = True
+            path = self._zstd_dict_path
+            if zstandard is not None and path is not None and path.exists():
+                self._zstd_dict = zstandard.ZstdCompressionDict(path.read_bytes())
+                logger.info(f"Loaded zstd dictionary {self._zstd_dict.dict_id()} from {path}")
+        return self._zstd_dict
+    
+    def train_dictionary(self, samples: List[bytes], dict_size: int = 16384) -> int:
+        """Train a zstd dictionary for ZSTD_JSON on sample payloads.
+        
+        Small states compress poorly on their own because they share little
+        context; a dictionary trained on typical JSON-encoded states supplies
+        it. The dictionary is persisted under serialization_dir and used for
+        all later ZSTD_JSON writes. Returns the dictionary id.
+        """
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to train a dictionary")
+        
+        zstd_dict = zstandard.train_dictionary(dict_size, samples)
+        self._zstd_dict = zstd_dict
+        self._zstd_dict_loaded = True
+        
+        path = self._zstd_dict_path
+        if path is not None:
+            path.write_bytes(zstd_dict.as_bytes())
+        
+        logger.info(f"Trained zstd dictionary {zstd_dict.dict_id()} from {len(samples)} samples")
+        return zstd_dict.dict_id()
+    
+    def _resolve_format(self, format: Optional[SerializationFormat]) -> SerializationFormat:
+        """Pick the format to write, falling back to gzip if zstd is unavailable."""
+        format = format or self.default_format
+        if format == SerializationFormat.ZSTD_JSON and zstandard is None:
+            logger.warning("zstandard not installed; using compressed_json (gzip) instead")
+            return SerializationFormat.COMPRESSED_JSON
+        if format == SerializationFormat.MSGPACK and msgspec is None:
+            logger.warning("msgspec not installed; using json instead")
+            return SerializationFormat.JSON
+        return format
+    
+    def _serialize_to_json(self, obj: Any) -> bytes:
+        """Serialize object to compact, key-sorted UTF-8 JSON."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder copes
+                pass
+        return json.dumps(obj, default=_json_default, sort_keys=True, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
     
-    def _deserialize_from_json(self, json_str: str) -> Any:
-        """Deserialize object from JSON."""
-        return json.loads(json_str)
+    def _deserialize_from_json(self, json_data: Union[str, bytes]) -> Any:
+        """Deserialize object from JSON text or UTF-8 bytes."""
+        if orjson is not None:
+            return orjson.loads(json_data)
+        return json.loads(json_data)
+    
+    def _serialize_to_msgpack(self, obj: Any) -> bytes:
+        """Serialize object to MessagePack."""
+        return _MSGPACK_ENCODER.encode(obj)
+    
+    def _deserialize_from_msgpack(self, data: bytes) -> Any:
+        """Deserialize object from MessagePack."""
+        if _MSGPACK_DECODER is None:
+            raise RuntimeError("msgspec is required to read msgpack data")
+        return _MSGPACK_DECODER.decode(data)
     
     def _serialize_to_pickle(self, obj: Any) -> bytes:
-        """Serialize object to pickle format."""
-        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        """Serialize object to pickle format.
+        
+        Protocol 5 is pinned rather than HIGHEST_PROTOCOL so payloads written
+        by newer interpreters stay loadable by older ones.
+        """
+        return pickle.dumps(obj, protocol=_PICKLE_PROTOCOL)
     
     def _deserialize_from_pickle(self, data: bytes) -> Any:
         """Deserialize object from pickle format."""
@@ -141,25 +474,16 @@ class NodeSerializer:
     
     def _prepare_state_for_serialization(self, state: ReviewState) -> Dict[str, Any]:
         """Prepare ReviewState for serialization by handling special types."""
-        prepared = {}
-        
-        for key, value in state.items():
-            if key == "status" and value:
-                prepared[key] = value.value if hasattr(value, 'value') else str(value)
-            elif key == "messages":
-                prepared[key] = [
-                    {
-                        "type": type(msg).__name__,
-                        "content": str(msg),
-                        "additional_kwargs": getattr(msg, 'additional_kwargs', {}),
-                        "response_metadata": getattr(msg, 'response_metadata', {})
-                    }
-                    for msg in (value or [])
-                ]
-            elif isinstance(value, (datetime,)):
-                prepared[key] = value.isoformat() if value else None
-            else:
-                prepared[key] = value
+        prepared = dict(state)
+        
+        for key, handler in _PREP_HANDLERS.items():
+            if key in prepared:
+                prepared[key] = handler(prepared[key])
+        
+        # Keys outside the ReviewState schema get the generic treatment
+        if not prepared.keys() <= _REVIEW_STATE_KEYS:
+            for key in prepared.keys() - _REVIEW_STATE_KEYS:
+                prepared[key] = _prep_datetime(prepared[key])
         
         return prepared
     
@@ -169,48 +493,79 @@ class NodeSerializer:
         
         # Restore status enum
         if "status" in restored and isinstance(restored["status"], str):
-            try:
-                restored["status"] = ReviewStatus(restored["status"])
-            except ValueError:
-                restored["status"] = ReviewStatus.INITIALIZING
+            restored["status"] = _STATUS_BY_VALUE.get(restored["status"], ReviewStatus.INITIALIZING)
         
         # Restore messages (simplified for debugging)
         if "messages" in restored:
             restored["messages"] = []  # Simplified for debugging
         
         # Ensure all required fields exist
-        defaults = {
-            "messages": [],
-            "current_step": "initializing",
-            "status": ReviewStatus.INITIALIZING,
-            "error_message": None,
-            "repository_url": "",
-            "repository_info": None,
-            "repository_type": None,
-            "enabled_tools": [],
-            "tool_results": {},
-            "failed_tools": [],
-            "analysis_results": None,
-            "files_analyzed": [],
-            "total_files": 0,
-            "review_config": {},
-            "start_time": None,
-            "end_time": None,
-            "notifications_sent": [],
-            "report_generated": False,
-            "final_report": None
-        }
-        
-        for key, default_value in defaults.items():
+        for key, default in _REVIEW_STATE_DEFAULTS:
             if key not in restored:
-                restored[key] = default_value
+                restored[key] = default() if callable(default) else default
         
         return restored
     
+    def _record_operation(self, metadata: SerializationMetadata):
+        """Append a serialization to the history and update the running totals."""
+        record = {
+            "timestamp": metadata.timestamp,
+            "node_name": metadata.node_name,
+            "data_type": metadata.data_type,
+            "format": metadata.format.value,
+            "size": metadata.original_size,
+            "checksum": metadata.checksum
+        }
+        with self._stats_lock:
+            self.serialization_history.append(record)
+            self._count_by_type[metadata.data_type] = self._count_by_type.get(metadata.data_type, 0) + 1
+            self._count_by_format[metadata.format.value] += 1
+            self._total_size += metadata.original_size
+    
+    def _encode_payload(self, obj: Any, format: SerializationFormat,
+                        node_name: str, data_type: str) -> SerializedData:
+        """Encode, optionally compress, and checksum an object.
+        
+        Each stage consumes the previous stage's buffer directly: the encoder
+        output feeds the one-shot compressor, and the checksum is taken over
+        the exact bytes that are stored.
+        """
+        dict_id = None
+        compressed = False
+        if format == SerializationFormat.PICKLE:
+            payload = self._serialize_to_pickle(obj)
+            original_size = len(payload)
+        elif format == SerializationFormat.MSGPACK:
+            payload = self._serialize_to_msgpack(obj)
+            original_size = len(payload)
+        elif format == SerializationFormat.JSON or format in _COMPRESSED_FORMATS:
+            payload = self._serialize_to_json(obj)
+            original_size = len(payload)
+            compressed = format in _COMPRESSED_FORMATS and self._should_compress(original_size, format)
+            if compressed:
+                payload, dict_id = self._compress_data(payload, format)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        metadata = SerializationMetadata(
+            format=format,
+            timestamp=_now_isoformat(),
+            version="1.0",
+            checksum=self._calculate_checksum(payload),
+            original_size=original_size,
+            compressed_size=len(payload) if compressed else None,
+            node_name=node_name,
+            data_type=data_type,
+            dict_id=dict_id,
+            compressed=compressed,
+            checksum_algo=_CHECKSUM_ALGO
+        )
+        return SerializedData(data=payload, metadata=metadata)
+    
     def serialize_node_input(self, node_name: str, input_state: ReviewState,
                            format: Optional[SerializationFormat] = None) -> SerializedData:
         """Serialize node input state for debugging and replay."""
-        format = format or self.default_format
+        format = self._resolve_format(format)
         
         logger.info(f"Serializing input for node: {node_name}", extra={
             "node_name": node_name,
@@ -222,58 +577,17 @@ class NodeSerializer:
             # Prepare state for serialization
             prepared_state = self._prepare_state_for_serialization(input_state)
             
-            # Serialize based on format
-            if format == SerializationFormat.JSON:
-                serialized_data = self._serialize_to_json(prepared_state)
-                data_bytes = serialized_data.encode('utf-8')
-            elif format == SerializationFormat.PICKLE:
-                data_bytes = self._serialize_to_pickle(prepared_state)
-                serialized_data = base64.b64encode(data_bytes).decode('utf-8')
-            elif format == SerializationFormat.COMPRESSED_JSON:
-                json_data = self._serialize_to_json(prepared_state)
-                data_bytes = json_data.encode('utf-8')
-                compressed_bytes = self._compress_data(data_bytes)
-                serialized_data = base64.b64encode(compressed_bytes).decode('utf-8')
-                data_bytes = compressed_bytes
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-            
-            # Calculate metadata
-            original_size = len(str(prepared_state).encode('utf-8'))
-            compressed_size = len(data_bytes) if format == SerializationFormat.COMPRESSED_JSON else None
-            checksum = self._calculate_checksum(data_bytes)
-            
-            metadata = SerializationMetadata(
-                format=format,
-                timestamp=datetime.now().isoformat(),
-                version="1.0",
-                checksum=checksum,
-                original_size=original_size,
-                compressed_size=compressed_size,
-                node_name=node_name,
-                data_type="input"
-            )
-            
-            result = SerializedData(
-                data=serialized_data,
-                metadata=metadata
-            )
+            result = self._encode_payload(prepared_state, format, node_name, "input")
+            metadata = result.metadata
             
             # Record serialization
-            self.serialization_history.append({
-                "timestamp": metadata.timestamp,
-                "node_name": node_name,
-                "data_type": "input",
-                "format": format.value,
-                "size": original_size,
-                "checksum": checksum
-            })
+            self._record_operation(metadata)
             
             logger.info(f"Successfully serialized input for {node_name}", extra={
-                "original_size": original_size,
-                "compressed_size": compressed_size,
+                "original_size": metadata.original_size,
+                "compressed_size": metadata.compressed_size,
                 "format": format.value,
-                "checksum": checksum[:8]
+                "checksum": metadata.checksum[:8]
             })
             
             return result
@@ -285,7 +599,7 @@ class NodeSerializer:
     def serialize_node_output(self, node_name: str, output_data: Dict[str, Any],
                             format: Optional[SerializationFormat] = None) -> SerializedData:
         """Serialize node output for debugging and replay."""
-        format = format or self.default_format
+        format = self._resolve_format(format)
         
         logger.info(f"Serializing output for node: {node_name}", extra={
             "node_name": node_name,
@@ -294,58 +608,17 @@ class NodeSerializer:
         })
         
         try:
-            # Serialize based on format
-            if format == SerializationFormat.JSON:
-                serialized_data = self._serialize_to_json(output_data)
-                data_bytes = serialized_data.encode('utf-8')
-            elif format == SerializationFormat.PICKLE:
-                data_bytes = self._serialize_to_pickle(output_data)
-                serialized_data = base64.b64encode(data_bytes).decode('utf-8')
-            elif format == SerializationFormat.COMPRESSED_JSON:
-                json_data = self._serialize_to_json(output_data)
-                data_bytes = json_data.encode('utf-8')
-                compressed_bytes = self._compress_data(data_bytes)
-                serialized_data = base64.b64encode(compressed_bytes).decode('utf-8')
-                data_bytes = compressed_bytes
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-            
-            # Calculate metadata
-            original_size = len(str(output_data).encode('utf-8'))
-            compressed_size = len(data_bytes) if format == SerializationFormat.COMPRESSED_JSON else None
-            checksum = self._calculate_checksum(data_bytes)
-            
-            metadata = SerializationMetadata(
-                format=format,
-                timestamp=datetime.now().isoformat(),
-                version="1.0",
-                checksum=checksum,
-                original_size=original_size,
-                compressed_size=compressed_size,
-                node_name=node_name,
-                data_type="output"
-            )
-            
-            result = SerializedData(
-                data=serialized_data,
-                metadata=metadata
-            )
+            result = self._encode_payload(output_data, format, node_name, "output")
+            metadata = result.metadata
             
             # Record serialization
-            self.serialization_history.append({
-                "timestamp": metadata.timestamp,
-                "node_name": node_name,
-                "data_type": "output",
-                "format": format.value,
-                "size": original_size,
-                "checksum": checksum
-            })
+            self._record_operation(metadata)
             
             logger.info(f"Successfully serialized output for {node_name}", extra={
-                "original_size": original_size,
-                "compressed_size": compressed_size,
+                "original_size": metadata.original_size,
+                "compressed_size": metadata.compressed_size,
                 "format": format.value,
-                "checksum": checksum[:8]
+                "checksum": metadata.checksum[:8]
             })
             
             return result
@@ -354,6 +627,37 @@ class NodeSerializer:
             logger.error(f"Failed to serialize output for {node_name}: {e}", exc_info=True)
             raise
     
+    def _decode_payload(self, serialized_data: SerializedData) -> Any:
+        """Decode a payload back to Python data according to its format."""
+        format = serialized_data.metadata.format
+        
+        # Deserialize based on format
+        if format == SerializationFormat.JSON:
+            return self._deserialize_from_json(serialized_data.data)
+        elif format == SerializationFormat.PICKLE:
+            return self._deserialize_from_pickle(serialized_data.data)
+        elif format == SerializationFormat.MSGPACK:
+            return self._deserialize_from_msgpack(serialized_data.data)
+        elif format in _COMPRESSED_FORMATS and not serialized_data.metadata.compressed:
+            return self._deserialize_from_json(serialized_data.data)
+        elif format in _COMPRESSED_FORMATS:
+            decompressed_bytes = self._decompress_data(
+                serialized_data.data, format, serialized_data.metadata.dict_id
+            )
+            return self._deserialize_from_json(decompressed_bytes)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+    
+    def deserialize_node_input_lazy(self, serialized_data: SerializedData) -> "LazySerializedState":
+        """Deserialize node input state on first access.
+        
+        Decompression, parsing and state restoration are deferred until a
+        field is read, so callers that may not look at the state skip them.
+        """
+        return LazySerializedState(
+            lambda: self._restore_state_from_serialization(self._decode_payload(serialized_data))
+        )
+    
     def deserialize_node_input(self, serialized_data: SerializedData) -> ReviewState:
         """Deserialize node input state."""
         logger.info(f"Deserializing input data", extra={
@@ -365,19 +669,7 @@ class NodeSerializer:
         try:
             format = serialized_data.metadata.format
             
-            # Deserialize based on format
-            if format == SerializationFormat.JSON:
-                data = self._deserialize_from_json(serialized_data.data)
-            elif format == SerializationFormat.PICKLE:
-                data_bytes = base64.b64decode(serialized_data.data)
-                data = self._deserialize_from_pickle(data_bytes)
-            elif format == SerializationFormat.COMPRESSED_JSON:
-                compressed_bytes = base64.b64decode(serialized_data.data)
-                decompressed_bytes = self._decompress_data(compressed_bytes)
-                json_str = decompressed_bytes.decode('utf-8')
-                data = self._deserialize_from_json(json_str)
-            else:
-                raise ValueError(f"Unsupported format: {format}")
+            data = self._decode_payload(serialized_data)
             
             # Restore state
             restored_state = self._restore_state_from_serialization(data)
@@ -404,19 +696,7 @@ class NodeSerializer:
         try:
             format = serialized_data.metadata.format
             
-            # Deserialize based on format
-            if format == SerializationFormat.JSON:
-                data = self._deserialize_from_json(serialized_data.data)
-            elif format == SerializationFormat.PICKLE:
-                data_bytes = base64.b64decode(serialized_data.data)
-                data = self._deserialize_from_pickle(data_bytes)
-            elif format == SerializationFormat.COMPRESSED_JSON:
-                compressed_bytes = base64.b64decode(serialized_data.data)
-                decompressed_bytes = self._decompress_data(compressed_bytes)
-                json_str = decompressed_bytes.decode('utf-8')
-                data = self._deserialize_from_json(json_str)
-            else:
-                raise ValueError(f"Unsupported format: {format}")
+            data = self._decode_payload(serialized_data)
             
             logger.info(f"Successfully deserialized output data", extra={
                 "format": format.value,
@@ -430,7 +710,11 @@ class NodeSerializer:
             raise
     
     def save_serialized_data(self, serialized_data: SerializedData, filename: str) -> Path:
-        """Save serialized data to file."""
+        """Save serialized data to file.
+        
+        JSON text is stored inline; binary payloads (pickle, msgpack, compressed JSON)
+        are written as is to a sidecar file named <filename>.bin next to it.
+        """
         if self.serialization_dir is None:
             logger.debug("Serialization directory not available, skipping file save")
             # Return a dummy path for compatibility
@@ -440,14 +724,22 @@ class NodeSerializer:
 
         try:
             # Create complete data structure with proper enum handling
-            metadata_dict = asdict(serialized_data.metadata)
-            metadata_dict["format"] = serialized_data.metadata.format.value  # Convert enum to value
+            metadata_dict = serialized_data.metadata.to_dict()
 
             complete_data = {
                 "schema_version": serialized_data.schema_version,
-                "metadata": metadata_dict,
-                "data": serialized_data.data
+                "metadata": metadata_dict
             }
+            
+            if _is_text_payload(serialized_data.metadata):
+                complete_data["data"] = serialized_data.data.decode('utf-8')
+            else:
+                # Appended rather than substituted for the suffix, so that
+                # "x.bin" or "x.v1"/"x.v2" never share a path with another file
+                data_path = filepath.with_name(filepath.name + '.bin')
+                with open(data_path, 'wb') as f:
+                    f.write(serialized_data.data)
+                complete_data["data_file"] = data_path.name
 
             with open(filepath, 'w') as f:
                 json.dump(complete_data, f, indent=2, default=str)
@@ -464,17 +756,35 @@ class NodeSerializer:
         filepath = Path(filepath)
         
         try:
-            with open(filepath, 'r') as f:
-                complete_data = json.load(f)
+            if orjson is not None:
+                # Parse straight from the mapped file instead of reading it
+                # into an intermediate string first
+                with open(filepath, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        # An empty file can't be mapped; let the parser reject it
+                        complete_data = orjson.loads(b"")
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                                memoryview(mm) as view:
+                            complete_data = orjson.loads(view)
+            else:
+                with open(filepath, 'r') as f:
+                    complete_data = json.load(f)
             
             # Reconstruct metadata
             metadata_dict = complete_data["metadata"]
-            metadata_dict["format"] = SerializationFormat(metadata_dict["format"])
+            metadata_dict["format"] = _FORMAT_BY_VALUE.get(metadata_dict["format"]) or SerializationFormat(metadata_dict["format"])
             metadata = SerializationMetadata(**metadata_dict)
             
+            if "data_file" in complete_data:
+                # Binary payload in a sidecar file
+                data = (filepath.parent / complete_data["data_file"]).read_bytes()
+            else:
+                data = complete_data["data"].encode('utf-8')
+            
             # Reconstruct serialized data
             serialized_data = SerializedData(
-                data=complete_data["data"],
+                data=data,
                 metadata=metadata,
                 schema_version=complete_data.get("schema_version", "1.0")
             )
@@ -494,7 +804,7 @@ class NodeSerializer:
             # Handle both enum string representation and enum value
             if format_value.startswith("SerializationFormat."):
                 format_value = format_value.split(".")[-1].lower()
-            format_enum = SerializationFormat(format_value)
+            format_enum = _FORMAT_BY_VALUE.get(format_value) or SerializationFormat(format_value)
         else:
             format_enum = format_value
 
@@ -506,24 +816,24 @@ class NodeSerializer:
             original_size=metadata_dict["original_size"],
             compressed_size=metadata_dict.get("compressed_size"),
             node_name=metadata_dict.get("node_name"),
-            data_type=metadata_dict["data_type"]
+            data_type=metadata_dict["data_type"],
+            dict_id=metadata_dict.get("dict_id"),
+            compressed=metadata_dict.get("compressed", True),
+            checksum_algo=metadata_dict.get("checksum_algo", "sha256")
         )
 
     def get_serialization_summary(self) -> Dict[str, Any]:
         """Get summary of serialization operations."""
-        return {
-            "total_operations": len(self.serialization_history),
-            "operations_by_type": {
-                "input": len([op for op in self.serialization_history if op["data_type"] == "input"]),
-                "output": len([op for op in self.serialization_history if op["data_type"] == "output"])
-            },
-            "operations_by_format": {
-                format.value: len([op for op in self.serialization_history if op["format"] == format.value])
-                for format in SerializationFormat
-            },
-            "total_size": sum(op["size"] for op in self.serialization_history),
-            "recent_operations": self.serialization_history[-5:] if self.serialization_history else []
-        }
+        with self._stats_lock:
+            return {
+                "total_operations": sum(self._count_by_type.values()),
+                "operations_by_type": dict(self._count_by_type),
+                "operations_by_format": dict(self._count_by_format),
+                "total_size": self._total_size,
+                "recent_operations": list(itertools.islice(
+                    self.serialization_history, max(0, len(self.serialization_history) - 5), None
+                ))
+            }
 
 
 # Global serializer instance
@@ -542,56 +852,16 @@ if __name__ == "__main__":
     # Example usage and testing
     import asyncio
 
+    import copy
+
+    _FIXTURE = json.loads(
+        (Path(__file__).parent.parent / "tests" / "fixtures" / "review_state.json").read_text()
+    )
+    _FIXTURE["status"] = ReviewStatus(_FIXTURE["status"])
+
     def create_test_state() -> ReviewState:
         """Create test state for serialization testing."""
-        return {
-            "messages": [],
-            "current_step": "analyze_code",
-            "status": ReviewStatus.ANALYZING_CODE,
-            "error_message": None,
-            "repository_url": "https://github.com/test/serialization-repo",
-            "repository_info": {
-                "url": "https://github.com/test/serialization-repo",
-                "name": "serialization-repo",
-                "full_name": "test/serialization-repo",
-                "description": "Test repository for serialization",
-                "language": "Python",
-                "stars": 10,
-                "forks": 2,
-                "size": 1024,
-                "default_branch": "main",
-                "topics": ["testing", "serialization"],
-                "file_structure": [
-                    {"path": "main.py", "type": "file", "size": 500},
-                    {"path": "test.py", "type": "file", "size": 300}
-                ],
-                "recent_commits": [
-                    {"sha": "abc123", "message": "Add serialization", "author": "tester"}
-                ]
-            },
-            "repository_type": "python",
-            "enabled_tools": ["pylint_analysis", "code_review"],
-            "tool_results": {
-                "pylint_analysis": {
-                    "tool_name": "pylint_analysis",
-                    "success": True,
-                    "result": {"score": 8.0, "issues": []},
-                    "error_message": None,
-                    "execution_time": 1.5,
-                    "timestamp": "2025-07-08T17:00:00"
-                }
-            },
-            "failed_tools": [],
-            "analysis_results": None,
-            "files_analyzed": ["main.py", "test.py"],
-            "total_files": 2,
-            "review_config": {"serialization_test": True},
-            "start_time": "2025-07-08T17:00:00",
-            "end_time": None,
-            "notifications_sent": [],
-            "report_generated": False,
-            "final_report": None
-        }
+        return copy.deepcopy(_FIXTURE)
 
     async def test_serialization():
         """Test the serialization functionality."""
@@ -604,10 +874,7 @@ if __name__ == "__main__":
         print("\n1. Testing input serialization...")
         test_state = create_test_state()
         
-        # Test different formats (excluding BINARY which is not implemented)
-        for format in [SerializationFormat.JSON, SerializationFormat.PICKLE, SerializationFormat.COMPRESSED_JSON]:
-            print(f"\nTesting format: {format.value}")
-            
+        def round_trip(format: SerializationFormat) -> SerializedData:
             # Serialize input
             serialized_input = serializer.serialize_node_input(
                 "test_node", test_state, format
@@ -621,8 +888,17 @@ if __name__ == "__main__":
             loaded_data = serializer.load_serialized_data(filepath)
             
             # Deserialize
-            restored_state = serializer.deserialize_node_input(loaded_data)
-            
+            serializer.deserialize_node_input(loaded_data)
+            return serialized_input
+        
+        # Test different formats (excluding BINARY which is not implemented);
+        # each round trip is mostly file I/O, so run them side by side
+        formats = [SerializationFormat.JSON, SerializationFormat.PICKLE, SerializationFormat.COMPRESSED_JSON,
+                   SerializationFormat.ZSTD_JSON, SerializationFormat.MSGPACK]
+        results = await asyncio.gather(*(asyncio.to_thread(round_trip, format) for format in formats))
+        
+        for format, serialized_input in zip(formats, results):
+            print(f"\nTesting format: {format.value}")
             print(f"✅ {format.value}: Original size: {serialized_input.metadata.original_size}, "
                   f"Compressed: {serialized_input.metadata.compressed_size or 'N/A'}")
         
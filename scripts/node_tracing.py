@@ -10,17 +10,34 @@ Part of Milestone 2: Individual Node Testing & Workflow Debugging
 """
 
 import asyncio
+import atexit
 import functools
+import hashlib
+import itertools
 import json
+import logging
+import os
+import threading
 import time
 import traceback
+from collections import OrderedDict, deque
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Union, Tuple, Deque
 from dataclasses import dataclass, asdict
 import sys
 
+try:
+    import orjson  # Optional: C-speed canonical JSON for state hashing
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: faster non-cryptographic state hashing
+except ImportError:
+    xxhash = None
+
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -39,8 +56,108 @@ initialize_logging(LoggingConfig(
 
 logger = get_logger(__name__)
 
+# Completed traces are appended to one NDJSON file; the buffer is flushed
+# every _TRACE_FLUSH_EVERY traces (and at exit) rather than per trace
+_TRACE_FILENAME = "traces.ndjson"
+_TRACE_BUFFER_SIZE = 1 << 16
+_TRACE_FLUSH_EVERY = 100
+
+# Tracing switches, on by default. NODE_TRACING=false makes @traced_node a
+# plain pass-through; the other two set NodeTracer's defaults
+_tracing_enabled = os.getenv("NODE_TRACING", "true").lower() == "true"
+_STATE_TRACKING_DEFAULT = os.getenv("NODE_TRACING_STATE", "true").lower() == "true"
+_PERFORMANCE_TRACKING_DEFAULT = os.getenv("NODE_TRACING_PERFORMANCE", "true").lower() == "true"
+
+# Completed traces kept in memory; older ones are still in traces.ndjson
+_TRACE_RETAIN = int(os.getenv("NODE_TRACE_RETAIN", "1000"))
+
+_ORJSON_HASH_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+_ORJSON_TRACE_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson is not None else 0
 
-@dataclass
+
+# State fields that stay the same object for a whole workflow run; their
+# encoded form is cached by identity when hashing states
+_STATIC_HASH_FIELDS = frozenset({"repository_url", "repository_info", "enabled_tools", "review_config"})
+_FIELD_CACHE_SIZE = 4096
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """obj encoded as compact, key-sorted JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_HASH_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder copes
+            pass
+    return json.dumps(obj, sort_keys=True, default=str, separators=(',', ':')).encode('utf-8')
+
+
+def _encode_trace_line(trace: "ExecutionTrace") -> bytes:
+    """One NDJSON line for a completed trace."""
+    if orjson is not None:
+        try:
+            # orjson serializes dataclasses natively, no asdict() copy needed
+            return orjson.dumps(trace, default=str, option=_ORJSON_TRACE_OPTIONS)
+        except TypeError:
+            pass
+    return (json.dumps(asdict(trace), default=str) + "\n").encode('utf-8')
+
+
+def _digest(data: bytes) -> str:
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _hash_json(obj: Any) -> str:
+    """Stable hex digest of obj's canonical JSON encoding."""
+    return _digest(_canonical_json(obj))
+
+
+def _cap_value(value: Any, limit: int) -> Any:
+    """value itself if its JSON form fits in limit bytes, else a truncated preview."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        if len(value) <= limit:
+            return value
+        preview, size = value[:limit], len(value)
+    else:
+        encoded = _canonical_json(value)
+        if len(encoded) <= limit:
+            return value
+        preview, size = encoded[:limit].decode('utf-8', errors='ignore'), len(encoded)
+    return {
+        "__truncated__": True,
+        "type": type(value).__name__,
+        "size": size,
+        "preview": preview
+    }
+
+
+def _values_differ(old: Any, new: Any) -> bool:
+    """Whether two state values differ, skipping children that are the same object.
+    
+    Nodes usually return updated containers that still share most of their
+    children with the input, so comparing identities first avoids walking
+    the unchanged subtrees.
+    """
+    if old is new:
+        return False
+    if type(old) is not type(new):
+        return old != new
+    if isinstance(old, dict):
+        if old.keys() != new.keys():
+            return True
+        return any(old[k] is not new[k] and old[k] != new[k] for k in old)
+    if isinstance(old, list):
+        if len(old) != len(new):
+            return True
+        return any(a is not b and a != b for a, b in zip(old, new))
+    return old != new
+
+
+@dataclass(slots=True)
 class ExecutionTrace:
     """Detailed execution trace for a node."""
     node_name: str
@@ -58,21 +175,11 @@ class ExecutionTrace:
     log_entries: List[Dict[str, Any]]
 
 
-@dataclass
-class StateChange:
-    """Represents a change in state during node execution."""
-    timestamp: str
-    field: str
-    old_value: Any
-    new_value: Any
-    change_type: str  # 'added', 'modified', 'removed'
-
-
 class NodeTracer:
     """Advanced tracing utility for node execution."""
     
-    def __init__(self, enable_state_tracking: bool = True, 
-                 enable_performance_tracking: bool = True,
+    def __init__(self, enable_state_tracking: bool = _STATE_TRACKING_DEFAULT, 
+                 enable_performance_tracking: bool = _PERFORMANCE_TRACKING_DEFAULT,
                  trace_output_dir: str = "logs/traces"):
         self.enable_state_tracking = enable_state_tracking
         self.enable_performance_tracking = enable_performance_tracking
@@ -93,88 +200,130 @@ class NodeTracer:
                 self.trace_output_dir = None
         
         self.active_traces: Dict[str, ExecutionTrace] = {}
-        self.completed_traces: List[ExecutionTrace] = []
+        self.completed_traces: Deque[ExecutionTrace] = deque(maxlen=_TRACE_RETAIN)
+        # perf_counter() at start of each active trace, for execution_time
+        self._trace_start_perf: Dict[str, float] = {}
+        
+        # (field, id(value)) -> (value, encoded value) for _STATIC_HASH_FIELDS;
+        # holding the value keeps its id from being reused while cached
+        self._field_cache: "OrderedDict[Tuple[str, int], Tuple[Any, bytes]]" = OrderedDict()
+        
+        # Buffered trace output, opened on first save. Inside an event loop,
+        # traces are handed to a writer task through _write_queue
+        self._trace_file = None
+        self._unflushed_traces = 0
+        self._write_lock = threading.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Performance tracking
         self.performance_thresholds = {
             "execution_time_warning": 1.0,  # seconds
             "execution_time_error": 5.0,    # seconds
             "memory_usage_warning": 100,    # MB
-            "state_size_warning": 10000     # bytes
+            "state_size_warning": 10000,    # bytes
+            "value_capture_limit": 2048     # bytes kept per traced value
         }
     
-    def generate_trace_id(self, node_name: str) -> str:
+    def generate_trace_id(self, node_name: str, now: Optional[datetime] = None) -> str:
         """Generate unique trace ID for node execution."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S_%f")
         return f"{node_name}_{timestamp}"
     
     def calculate_state_hash(self, state: ReviewState) -> str:
         """Calculate hash of state for change detection."""
         try:
-            state_str = json.dumps(self._serialize_state_for_hash(state), sort_keys=True)
-            return str(hash(state_str))
+            serialized = self._serialize_state_for_hash(state)
+            fields = [
+                _canonical_json(key) + b":" + self._encode_field_for_hash(key, serialized[key])
+                for key in sorted(serialized)
+            ]
+            return _digest(b"{" + b",".join(fields) + b"}")
         except Exception:
             return "hash_error"
     
+    def _encode_field_for_hash(self, key: str, value: Any) -> bytes:
+        """Canonical JSON for one state field, reusing cached static fields."""
+        if key not in _STATIC_HASH_FIELDS:
+            return _canonical_json(value)
+        
+        cache_key = (key, id(value))
+        cached = self._field_cache.get(cache_key)
+        if cached is not None and cached[0] is value:
+            self._field_cache.move_to_end(cache_key)
+            return cached[1]
+        
+        encoded = _canonical_json(value)
+        self._field_cache[cache_key] = (value, encoded)
+        if len(self._field_cache) > _FIELD_CACHE_SIZE:
+            self._field_cache.popitem(last=False)
+        return encoded
+    
     def _serialize_state_for_hash(self, state: ReviewState) -> Dict[str, Any]:
         """Serialize state for hash calculation."""
-        serialized = {}
-        for key, value in state.items():
-            if key == "status" and value:
-                serialized[key] = value.value if hasattr(value, 'value') else str(value)
-            elif key == "messages":
-                serialized[key] = [str(msg) for msg in (value or [])]
-            else:
-                serialized[key] = value
+        # Only status and messages need converting; copy the rest in C
+        serialized = dict(state)
+        status = serialized.get("status")
+        if status:
+            serialized["status"] = status.value if hasattr(status, 'value') else str(status)
+        if "messages" in serialized:
+            serialized["messages"] = [str(msg) for msg in (serialized["messages"] or [])]
         return serialized
     
-    def detect_state_changes(self, old_state: ReviewState, new_state: ReviewState) -> List[StateChange]:
-        """Detect changes between two states."""
+    def detect_state_changes(self, old_state: ReviewState, new_state: ReviewState) -> List[Dict[str, Any]]:
+        """Detect changes between two states.
+        
+        Each change is a dict with timestamp, field, old_value, new_value and
+        change_type ('added', 'modified' or 'removed'), stored in the trace as is.
+        """
         changes = []
         timestamp = datetime.now().isoformat()
+        limit = self.performance_thresholds["value_capture_limit"]
         
         # Get all keys from both states
-        all_keys = set(old_state.keys()) | set(new_state.keys())
+        all_keys = old_state.keys() | new_state.keys()
         
         for key in all_keys:
             old_value = old_state.get(key)
             new_value = new_state.get(key)
             
             if key not in old_state:
-                changes.append(StateChange(
-                    timestamp=timestamp,
-                    field=key,
-                    old_value=None,
-                    new_value=new_value,
-                    change_type="added"
-                ))
+                changes.append({
+                    "timestamp": timestamp,
+                    "field": key,
+                    "old_value": None,
+                    "new_value": _cap_value(new_value, limit),
+                    "change_type": "added"
+                })
             elif key not in new_state:
-                changes.append(StateChange(
-                    timestamp=timestamp,
-                    field=key,
-                    old_value=old_value,
-                    new_value=None,
-                    change_type="removed"
-                ))
-            elif old_value != new_value:
-                changes.append(StateChange(
-                    timestamp=timestamp,
-                    field=key,
-                    old_value=old_value,
-                    new_value=new_value,
-                    change_type="modified"
-                ))
+                changes.append({
+                    "timestamp": timestamp,
+                    "field": key,
+                    "old_value": _cap_value(old_value, limit),
+                    "new_value": None,
+                    "change_type": "removed"
+                })
+            elif old_value is not new_value and _values_differ(old_value, new_value):
+                changes.append({
+                    "timestamp": timestamp,
+                    "field": key,
+                    "old_value": _cap_value(old_value, limit),
+                    "new_value": _cap_value(new_value, limit),
+                    "change_type": "modified"
+                })
         
         return changes
     
     def start_trace(self, node_name: str, input_state: ReviewState) -> str:
         """Start tracing node execution."""
-        trace_id = self.generate_trace_id(node_name)
+        now = datetime.now()
+        trace_id = self.generate_trace_id(node_name, now)
         
         trace = ExecutionTrace(
             node_name=node_name,
             trace_id=trace_id,
-            start_time=datetime.now().isoformat(),
+            start_time=now.isoformat(),
             end_time=None,
             execution_time=None,
             input_state_hash=self.calculate_state_hash(input_state),
@@ -188,13 +337,15 @@ class NodeTracer:
         )
         
         self.active_traces[trace_id] = trace
+        self._trace_start_perf[trace_id] = time.perf_counter()
         
-        logger.info(f"Started tracing node execution", extra={
-            "trace_id": trace_id,
-            "node_name": node_name,
-            "input_state_hash": trace.input_state_hash,
-            "tracing_enabled": True
-        })
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Started tracing node execution", extra={
+                "trace_id": trace_id,
+                "node_name": node_name,
+                "input_state_hash": trace.input_state_hash,
+                "tracing_enabled": True
+            })
         
         return trace_id
     
@@ -206,12 +357,8 @@ class NodeTracer:
             return None
         
         trace = self.active_traces[trace_id]
-        end_time = datetime.now()
-        trace.end_time = end_time.isoformat()
-        
-        # Calculate execution time
-        start_time = datetime.fromisoformat(trace.start_time)
-        trace.execution_time = (end_time - start_time).total_seconds()
+        trace.execution_time = time.perf_counter() - self._trace_start_perf.pop(trace_id)
+        trace.end_time = datetime.now().isoformat()
         
         # Handle success/error
         if error:
@@ -221,7 +368,7 @@ class NodeTracer:
         else:
             trace.success = True
             if output_result:
-                trace.output_hash = str(hash(json.dumps(output_result, sort_keys=True, default=str)))
+                trace.output_hash = _hash_json(output_result)
         
         # Performance analysis
         if self.enable_performance_tracking:
@@ -231,13 +378,14 @@ class NodeTracer:
         self.completed_traces.append(trace)
         del self.active_traces[trace_id]
         
-        logger.info(f"Completed tracing node execution", extra={
-            "trace_id": trace_id,
-            "node_name": trace.node_name,
-            "execution_time": trace.execution_time,
-            "success": trace.success,
-            "error_message": trace.error_message
-        })
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Completed tracing node execution", extra={
+                "trace_id": trace_id,
+                "node_name": trace.node_name,
+                "execution_time": trace.execution_time,
+                "success": trace.success,
+                "error_message": trace.error_message
+            })
         
         # Save trace to file
         self._save_trace_to_file(trace)
@@ -246,21 +394,23 @@ class NodeTracer:
     
     def _analyze_performance(self, trace: ExecutionTrace) -> Dict[str, Any]:
         """Analyze performance metrics for the trace."""
-        metrics = {
-            "execution_time": trace.execution_time,
-            "performance_warnings": [],
-            "performance_score": "good"
-        }
+        execution_time = trace.execution_time
+        
+        # Common case: under both thresholds, nothing to report
+        if execution_time <= self.performance_thresholds["execution_time_warning"]:
+            return {"execution_time": execution_time, "performance_warnings": [], "performance_score": "good"}
         
         # Check execution time thresholds
-        if trace.execution_time > self.performance_thresholds["execution_time_error"]:
-            metrics["performance_warnings"].append(f"Execution time exceeded error threshold: {trace.execution_time:.2f}s")
-            metrics["performance_score"] = "poor"
-        elif trace.execution_time > self.performance_thresholds["execution_time_warning"]:
-            metrics["performance_warnings"].append(f"Execution time exceeded warning threshold: {trace.execution_time:.2f}s")
-            metrics["performance_score"] = "fair"
-        
-        return metrics
+        if execution_time > self.performance_thresholds["execution_time_error"]:
+            level, score = "error", "poor"
+        else:
+            level, score = "warning", "fair"
+        
+        return {
+            "execution_time": execution_time,
+            "performance_warnings": [f"Execution time exceeded {level} threshold: {execution_time:.2f}s"],
+            "performance_score": score
+        }
     
     def add_state_change(self, trace_id: str, old_state: ReviewState, new_state: ReviewState):
         """Add state change information to trace."""
@@ -270,51 +420,126 @@ class NodeTracer:
         changes = self.detect_state_changes(old_state, new_state)
         trace = self.active_traces[trace_id]
         
-        for change in changes:
-            trace.state_changes.append(asdict(change))
-            
-            logger.debug(f"State change detected", extra={
-                "trace_id": trace_id,
-                "field": change.field,
-                "change_type": change.change_type,
-                "old_value": str(change.old_value)[:100],  # Truncate for logging
-                "new_value": str(change.new_value)[:100]
-            })
+        trace.state_changes.extend(changes)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for change in changes:
+                logger.debug(f"State change detected", extra={
+                    "trace_id": trace_id,
+                    "field": change["field"],
+                    "change_type": change["change_type"],
+                    "old_value": str(change["old_value"])[:100],  # Truncate for logging
+                    "new_value": str(change["new_value"])[:100]
+                })
+    
+    def add_result_diff(self, trace_id: str, state: ReviewState, result: Dict[str, Any]):
+        """Add the state changes made by a node's returned update to trace.
+        
+        state must be the input as it was before the node ran (a shallow copy
+        is enough), since nodes may assign to their input. Only keys present
+        in result can change when it is merged into state, so just those are
+        compared.
+        """
+        if not result:
+            return
+        old_values = {key: state[key] for key in result if key in state}
+        self.add_state_change(trace_id, old_values, result)
     
     def add_log_entry(self, trace_id: str, level: str, message: str, extra_data: Dict[str, Any] = None):
         """Add log entry to trace."""
         if trace_id not in self.active_traces:
             return
         
+        limit = self.performance_thresholds["value_capture_limit"]
         log_entry = {
             "timestamp": datetime.now().isoformat(),
             "level": level,
             "message": message,
-            "extra_data": extra_data or {}
+            "extra_data": {key: _cap_value(value, limit) for key, value in (extra_data or {}).items()}
         }
         
         self.active_traces[trace_id].log_entries.append(log_entry)
     
     def _save_trace_to_file(self, trace: ExecutionTrace):
-        """Save trace to JSON file."""
+        """Queue trace for the background writer, or write it directly outside a loop."""
         if self.trace_output_dir is None:
             logger.debug("Trace output directory not available, skipping file save")
             return
 
         try:
-            filename = f"{trace.node_name}_{trace.trace_id}.json"
-            filepath = self.trace_output_dir / filename
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_traces([trace])
+            return
 
-            trace_data = asdict(trace)
+        if self._writer_task is None or self._writer_task.done() or self._writer_loop is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_loop = loop
+            self._writer_task = loop.create_task(self._drain_trace_queue())
+        self._write_queue.put_nowait(trace)
+    
+    async def _drain_trace_queue(self):
+        """Write queued traces in batches off the event loop."""
+        queue = self._write_queue
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty() and len(batch) < _TRACE_FLUSH_EVERY:
+                    batch.append(queue.get_nowait())
+                try:
+                    await asyncio.to_thread(self._write_traces, batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            # Cancelled (e.g. the loop is shutting down): write what is left
+            remaining = []
+            while not queue.empty():
+                remaining.append(queue.get_nowait())
+                queue.task_done()
+            if remaining:
+                self._write_traces(remaining)
+    
+    def _write_traces(self, traces: List[ExecutionTrace]):
+        """Append traces, one per line, to the buffered traces.ndjson file."""
+        try:
+            with self._write_lock:
+                if self._trace_file is None:
+                    filepath = self.trace_output_dir / _TRACE_FILENAME
+                    self._trace_file = open(filepath, 'ab', buffering=_TRACE_BUFFER_SIZE)
+                    atexit.register(self.flush_traces)
 
-            with open(filepath, 'w') as f:
-                json.dump(trace_data, f, indent=2, default=str)
+                for trace in traces:
+                    self._trace_file.write(_encode_trace_line(trace))
+                self._unflushed_traces += len(traces)
+                if self._unflushed_traces >= _TRACE_FLUSH_EVERY:
+                    self._trace_file.flush()
+                    self._unflushed_traces = 0
 
-            logger.debug(f"Trace saved to file: {filepath}")
+            logger.debug(f"Buffered {len(traces)} trace(s) for file")
 
         except Exception as e:
             logger.error(f"Failed to save trace to file: {e}")
     
+    def flush_traces(self):
+        """Write buffered traces out to traces.ndjson."""
+        if self._trace_file is None:
+            return
+        try:
+            with self._write_lock:
+                self._trace_file.flush()
+                self._unflushed_traces = 0
+        except Exception as e:
+            logger.error(f"Failed to flush traces: {e}")
+    
+    async def aclose(self):
+        """Wait for queued traces to be written, then flush the trace file."""
+        if self._writer_task is not None and self._writer_loop is asyncio.get_running_loop():
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+        self.flush_traces()
+    
     def get_trace_summary(self, trace_id: str) -> Optional[Dict[str, Any]]:
         """Get summary of a trace."""
         # Check active traces first
@@ -325,11 +550,11 @@ class NodeTracer:
                 "node_name": trace.node_name,
                 "status": "active",
                 "start_time": trace.start_time,
-                "duration": (datetime.now() - datetime.fromisoformat(trace.start_time)).total_seconds()
+                "duration": time.perf_counter() - self._trace_start_perf[trace_id]
             }
         
         # Check completed traces
-        for trace in self.completed_traces:
+        for trace in reversed(self.completed_traces):
             if trace.trace_id == trace_id:
                 return {
                     "trace_id": trace.trace_id,
@@ -345,6 +570,8 @@ class NodeTracer:
     
     def get_all_traces_summary(self) -> Dict[str, Any]:
         """Get summary of all traces."""
+        recent = list(itertools.islice(reversed(self.completed_traces), 5))
+        recent.reverse()
         return {
             "active_traces": len(self.active_traces),
             "completed_traces": len(self.completed_traces),
@@ -357,7 +584,7 @@ class NodeTracer:
                     "success": trace.success,
                     "execution_time": trace.execution_time
                 }
-                for trace in self.completed_traces[-5:]  # Last 5 traces
+                for trace in recent  # Last 5 traces
             ]
         }
 
@@ -374,44 +601,55 @@ def get_tracer() -> NodeTracer:
     return _global_tracer
 
 
+def set_tracing_enabled(enabled: bool):
+    """Turn @traced_node tracing on or off at runtime (default: NODE_TRACING)."""
+    global _tracing_enabled
+    _tracing_enabled = enabled
+
+
 def traced_node(func: Callable) -> Callable:
     """Decorator to add tracing to node functions."""
+    node_name = func.__name__
+    
     @functools.wraps(func)
     async def wrapper(state: ReviewState) -> Dict[str, Any]:
-        tracer = get_tracer()
-        node_name = func.__name__
+        if not _tracing_enabled:
+            return await func(state)
+        
+        # The global tracer is still looked up per call so it can be replaced
+        tracer = _global_tracer or get_tracer()
         
         # Start tracing
         trace_id = tracer.start_trace(node_name, state)
         
         try:
-            # Store original state for change detection
-            original_state = state.copy() if tracer.enable_state_tracking else None
-            
             # Execute the node function
-            logger.info(f"Executing node with tracing", extra={
-                "node_name": node_name,
-                "trace_id": trace_id,
-                "input_state_keys": list(state.keys())
-            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Executing node with tracing", extra={
+                    "node_name": node_name,
+                    "trace_id": trace_id,
+                    "input_state_keys": list(state.keys())
+                })
+            
+            # Top-level values before the call, in case the node assigns to
+            # its input; only top-level keys are diffed
+            state_before = dict(state) if tracer.enable_state_tracking else None
             
             result = await func(state)
             
             # Detect state changes if enabled
-            if tracer.enable_state_tracking and original_state:
-                # Create new state with result applied
-                new_state = state.copy()
-                new_state.update(result)
-                tracer.add_state_change(trace_id, original_state, new_state)
+            if state_before is not None:
+                tracer.add_result_diff(trace_id, state_before, result)
             
             # End tracing successfully
             tracer.end_trace(trace_id, result)
             
-            logger.info(f"Node execution completed successfully", extra={
-                "node_name": node_name,
-                "trace_id": trace_id,
-                "output_keys": list(result.keys()) if result else []
-            })
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Node execution completed successfully", extra={
+                    "node_name": node_name,
+                    "trace_id": trace_id,
+                    "output_keys": list(result.keys()) if result else []
+                })
             
             return result
             
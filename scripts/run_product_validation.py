@@ -17,9 +17,17 @@ import argparse
 import json
 import sys
 import os
+from collections import Counter
+from dataclasses import asdict, is_dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster result/report files
+except ImportError:
+    orjson = None
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -30,6 +38,28 @@ except ImportError:
     print("Error: Could not import validation dashboard. Please ensure all dependencies are installed.")
     sys.exit(1)
 
+def _json_default(obj):
+    """Encode validation objects orjson/json don't handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, '__dict__'):
+        return vars(obj)
+    return str(obj)
+
+
+def _write_json(filepath: Path, payload):
+    """Write payload as indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(payload, default=_json_default,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(filepath, 'w') as f:
+        json.dump(payload, f, indent=2, default=_json_default)
+
+
 class ProductValidationRunner:
     """Main runner for Product Manager validation tasks."""
     
@@ -38,6 +68,36 @@ class ProductValidationRunner:
         self.results_dir = project_root / "validation" / "results"
         self.results_dir.mkdir(parents=True, exist_ok=True)
     
+    async def _run_suites(self, suite_names, concurrency: int = 4):
+        """Run validation suites concurrently and print their summaries in order.
+        
+        Suites spend most of their time waiting on the components they
+        validate, so up to `concurrency` of them run at once.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_suite(suite_name):
+            async with semaphore:
+                print(f"\n📋 Running {suite_name}...")
+                return await self.dashboard.run_validation_suite(suite_name)
+        
+        outcomes = await asyncio.gather(
+            *(run_suite(suite_name) for suite_name in suite_names),
+            return_exceptions=True
+        )
+        
+        all_results = []
+        for suite_name, outcome in zip(suite_names, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ Error running {suite_name}: {str(outcome)}")
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                all_results.extend(outcome)
+                self._print_suite_summary(suite_name, outcome)
+        
+        return all_results
+    
     async def run_daily_validation(self):
         """Run daily validation suite."""
         print("🔄 Running Daily Validation Suite...")
@@ -49,15 +109,7 @@ class ProductValidationRunner:
             "performance_monitoring"
         ]
         
-        all_results = []
-        for suite_name in suites_to_run:
-            print(f"\n📋 Running {suite_name}...")
-            try:
-                results = await self.dashboard.run_validation_suite(suite_name)
-                all_results.extend(results)
-                self._print_suite_summary(suite_name, results)
-            except Exception as e:
-                print(f"❌ Error running {suite_name}: {str(e)}")
+        all_results = await self._run_suites(suites_to_run)
         
         self._print_overall_summary(all_results, "Daily Validation")
         self._save_results(all_results, "daily")
@@ -77,15 +129,7 @@ class ProductValidationRunner:
             "user_experience"
         ]
         
-        all_results = []
-        for suite_name in suites_to_run:
-            print(f"\n📋 Running {suite_name}...")
-            try:
-                results = await self.dashboard.run_validation_suite(suite_name)
-                all_results.extend(results)
-                self._print_suite_summary(suite_name, results)
-            except Exception as e:
-                print(f"❌ Error running {suite_name}: {str(e)}")
+        all_results = await self._run_suites(suites_to_run)
         
         self._print_overall_summary(all_results, "Weekly Validation")
         self._save_results(all_results, "weekly")
@@ -98,16 +142,7 @@ class ProductValidationRunner:
         print("=" * 50)
         
         all_suite_names = list(self.dashboard.validation_suites.keys())
-        all_results = []
-        
-        for suite_name in all_suite_names:
-            print(f"\n📋 Running {suite_name}...")
-            try:
-                results = await self.dashboard.run_validation_suite(suite_name)
-                all_results.extend(results)
-                self._print_suite_summary(suite_name, results)
-            except Exception as e:
-                print(f"❌ Error running {suite_name}: {str(e)}")
+        all_results = await self._run_suites(all_suite_names)
         
         self._print_overall_summary(all_results, "Complete Validation")
         self._save_results(all_results, "complete")
@@ -160,9 +195,10 @@ class ProductValidationRunner:
     
     def _print_suite_summary(self, suite_name: str, results):
         """Print summary for a validation suite."""
-        passed = len([r for r in results if r.status == ValidationStatus.PASS])
-        failed = len([r for r in results if r.status == ValidationStatus.FAIL])
-        warnings = len([r for r in results if r.status == ValidationStatus.WARNING])
+        counts = Counter(r.status for r in results)
+        passed = counts[ValidationStatus.PASS]
+        failed = counts[ValidationStatus.FAIL]
+        warnings = counts[ValidationStatus.WARNING]
         total = len(results)
         
         success_rate = (passed / total * 100) if total > 0 else 0
@@ -170,7 +206,7 @@ class ProductValidationRunner:
         print(f"   Results: {passed}✅ {failed}❌ {warnings}⚠️  ({success_rate:.1f}% success)")
         
         # Show failed tests
-        failed_tests = [r for r in results if r.status == ValidationStatus.FAIL]
+        failed_tests = [r for r in results if r.status == ValidationStatus.FAIL] if failed else []
         if failed_tests:
             print(f"   Failed Tests:")
             for test in failed_tests:
@@ -180,9 +216,10 @@ class ProductValidationRunner:
     def _print_overall_summary(self, all_results, validation_type):
         """Print overall validation summary."""
         total = len(all_results)
-        passed = len([r for r in all_results if r.status == ValidationStatus.PASS])
-        failed = len([r for r in all_results if r.status == ValidationStatus.FAIL])
-        warnings = len([r for r in all_results if r.status == ValidationStatus.WARNING])
+        counts = Counter(r.status for r in all_results)
+        passed = counts[ValidationStatus.PASS]
+        failed = counts[ValidationStatus.FAIL]
+        warnings = counts[ValidationStatus.WARNING]
         
         success_rate = (passed / total * 100) if total > 0 else 0
         
@@ -204,7 +241,10 @@ class ProductValidationRunner:
             print(f"🚨 Status: Multiple failures - investigation required")
         
         # Critical failures
-        critical_failures = [r for r in all_results if r.status == ValidationStatus.FAIL and r.priority == ValidationPriority.CRITICAL]
+        critical_failures = [
+            r for r in all_results
+            if r.status == ValidationStatus.FAIL and r.priority == ValidationPriority.CRITICAL
+        ] if failed else []
         if critical_failures:
             print(f"\n🚨 CRITICAL FAILURES DETECTED:")
             for failure in critical_failures:
@@ -216,25 +256,12 @@ class ProductValidationRunner:
         filename = f"{validation_type}_validation_{timestamp}.json"
         filepath = self.results_dir / filename
         
-        # Convert results to serializable format
-        serializable_results = []
-        for result in results:
-            serializable_results.append({
-                "test_name": result.test_name,
-                "status": result.status.value,
-                "priority": result.priority.value,
-                "execution_time": result.execution_time,
-                "message": result.message,
-                "details": result.details,
-                "timestamp": result.timestamp
-            })
-        
-        with open(filepath, 'w') as f:
-            json.dump({
-                "validation_type": validation_type,
-                "timestamp": timestamp,
-                "results": serializable_results
-            }, f, indent=2)
+        # Results (dataclasses with enum fields) are encoded directly
+        _write_json(filepath, {
+            "validation_type": validation_type,
+            "timestamp": timestamp,
+            "results": list(results)
+        })
         
         print(f"📁 Results saved to: {filepath}")
     
@@ -244,8 +271,7 @@ class ProductValidationRunner:
         filename = f"validation_report_{timestamp}.json"
         filepath = self.results_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json(filepath, report)
         
         print(f"📁 Report saved to: {filepath}")
 
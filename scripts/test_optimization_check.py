@@ -4,129 +4,170 @@ Test optimization verification script.
 This script simulates the GitHub Actions test execution to verify optimizations work.
 """
 
-import subprocess
+import argparse
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 
-def run_command(cmd, timeout=300):
-    """Run a command with timeout and return result."""
-    print(f"Running: {cmd}")
-    start_time = time.time()
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        duration = time.time() - start_time
-        print(f"Completed in {duration:.2f}s")
-        return result, duration
-    except subprocess.TimeoutExpired:
-        print(f"Command timed out after {timeout}s")
-        return None, timeout
-
-def test_unit_core():
-    """Test core unit tests."""
-    cmd = """python -m pytest \
-        tests/test_registry.py \
-        tests/test_error_handling.py \
-        tests/test_tool_health.py \
-        -m "not integration and not real_params and not performance" \
-        --tb=short \
-        -v \
-        --disable-warnings \
-        --maxfail=5 \
-        -n 2"""
-    
-    result, duration = run_command(cmd, timeout=900)  # 15 minutes
-    if result and result.returncode == 0:
-        print("✅ Core unit tests passed")
-        return True
-    else:
-        print("❌ Core unit tests failed")
-        if result:
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-        return False
-
-def test_unit_tools():
-    """Test tool unit tests."""
-    cmd = """python -m pytest \
-        tests/test_ai_analysis_tools.py \
-        tests/test_static_analysis_tools.py \
-        tests/test_filesystem_tools.py \
-        tests/test_github_tools.py \
-        tests/test_communication_tools.py \
-        -m "not integration and not real_params and not performance" \
-        --tb=short \
-        -v \
-        --disable-warnings \
-        --maxfail=10 \
-        -n 2"""
-    
-    result, duration = run_command(cmd, timeout=1200)  # 20 minutes
-    if result and result.returncode == 0:
-        print("✅ Tool unit tests passed")
-        return True
-    else:
-        print("❌ Tool unit tests failed")
-        if result:
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-        return False
-
-def test_performance():
-    """Test performance tests."""
-    cmd = """python -m pytest \
-        tests/test_performance.py \
-        -m "performance" \
-        --tb=short \
-        -v \
-        --disable-warnings \
-        --durations=10 \
-        --maxfail=3"""
-    
-    result, duration = run_command(cmd, timeout=600)  # 10 minutes
-    if result and result.returncode == 0:
-        print("✅ Performance tests passed")
-        return True
-    else:
-        print("❌ Performance tests failed")
-        if result:
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-        return False
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Unit categories skip integration/real-API/performance tests
+UNIT_MARKS = "not integration and not real_params and not performance"
+
+# Test categories as run in GitHub Actions, by test file relative to
+# PROJECT_ROOT. Each group runs in its own pytest session with the mark
+# expression and parallelism its categories get in CI.
+TEST_SESSIONS = [
+    (UNIT_MARKS, ["-n", "auto", "--dist", "worksteal"], [
+        ("Core Unit Tests", [
+            "tests/test_registry.py",
+            "tests/test_error_handling.py",
+            "tests/test_tool_health.py",
+        ]),
+        ("Tool Unit Tests", [
+            "tests/test_ai_analysis_tools.py",
+            "tests/test_static_analysis_tools.py",
+            "tests/test_filesystem_tools.py",
+            "tests/test_github_tools.py",
+            "tests/test_communication_tools.py",
+        ]),
+    ]),
+    # Serial, after the unit tests: parallel workers skew timing measurements
+    ("performance", ["-n", "0"], [
+        ("Performance Tests", [
+            "tests/test_performance.py",
+        ]),
+    ]),
+]
+
+TEST_CATEGORIES = [category for _, _, categories in TEST_SESSIONS for category in categories]
+
+# Quiet pytest output keeps CI logs small; --debug restores per-test lines
+# and full tracebacks
+QUIET_ARGS = ["-q", "--tb=line", "--no-header"]
+DEBUG_ARGS = ["-v", "--tb=long"]
+
+# Incremental runs: only last run's failures (or everything if none failed),
+# failures first
+CACHE_ARGS = ["--lf", "--ff", "-o", "cache_dir=.pytest_cache"]
+
+# Per-test limit (pytest-timeout), so a hung test fails instead of blocking
+# the in-process session forever. pytest.ini sets the same value, but its
+# [tool:pytest] section is ignored, so pass it explicitly.
+TEST_TIMEOUT_SECONDS = 300
+
+# Summary labels by category status
+STATUS_LABELS = {
+    "pass": "✅ PASS",
+    "fail": "❌ FAIL",
+    # --lf deselected the whole category: nothing in it failed last run
+    "cached": "⏭️ not run (cached pass)",
+}
+
+
+class ResultCollector:
+    """pytest plugin that tallies test outcomes per category by test file."""
+
+    def __init__(self, categories):
+        self._category_by_file = {path: name for name, paths in categories for path in paths}
+        self.passed = Counter()
+        self.failed = Counter()
+        self.skipped = Counter()
+
+    def pytest_runtest_logreport(self, report):
+        category = self._category_by_file.get(report.nodeid.split("::", 1)[0])
+        if category is None:
+            return
+        if report.failed:
+            self.failed[category] += 1
+        elif report.skipped:
+            self.skipped[category] += 1
+        elif report.passed and report.when == "call":
+            self.passed[category] += 1
+
+    def reported(self, category):
+        """Number of tests in category that ran or were skipped."""
+        return self.passed[category] + self.failed[category] + self.skipped[category]
+
+
+def category_status(collector, name, session_ok, full=False):
+    """Summary status of one category: "pass", "fail" or "cached"."""
+    if not session_ok or collector.failed[name]:
+        return "fail"
+    if not collector.reported(name):
+        # Without the cache an empty category means its tests are missing
+        return "fail" if full else "cached"
+    return "pass"
+
+
+def run_session(marks, session_args, categories, collector, full=False, debug=False):
+    """Run one group of categories in an in-process pytest session.
+
+    Returns False if the session itself broke (usage, internal or collection
+    errors, interruption) rather than just having failing tests.
+    """
+    args = [str(PROJECT_ROOT / path) for _, paths in categories for path in paths] + [
+        "--rootdir", str(PROJECT_ROOT),  # node ids and the cache dir stay relative to the project
+        "-m", marks,
+        *(DEBUG_ARGS if debug else QUIET_ARGS),
+        "--disable-warnings",
+        "--maxfail=0",  # run every category to the end so each gets a verdict
+        "--durations=10",
+        "--timeout", str(TEST_TIMEOUT_SECONDS),
+        *session_args
+    ]
+    if not full:
+        args += CACHE_ARGS
+
+    print(f"Running: pytest {' '.join(args)}")
+    exit_code = pytest.main(args, plugins=[collector])
+    return exit_code in (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
+
+
+def run_tests(full=False, debug=False):
+    """Run every category, one pytest session per group in TEST_SESSIONS."""
+    collector = ResultCollector(TEST_CATEGORIES)
+    results = []
+    start_time = time.perf_counter()
+    for marks, session_args, categories in TEST_SESSIONS:
+        session_ok = run_session(marks, session_args, categories, collector, full=full, debug=debug)
+        # A broken session fails every category in it
+        results += [
+            (name, category_status(collector, name, session_ok, full=full))
+            for name, _ in categories
+        ]
+    duration = time.perf_counter() - start_time
+    print(f"Completed in {duration:.2f}s")
+    return results
 
 def main():
     """Main test execution."""
+    parser = argparse.ArgumentParser(description="Test optimization verification")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run every test instead of only those that failed last time"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Show every test and full tracebacks"
+    )
+    args = parser.parse_args()
+
     print("🚀 Starting test optimization verification...")
-    
-    # Change to project root
-    project_root = Path(__file__).parent.parent
-    import os
-    os.chdir(project_root)
-    
-    results = []
-    
-    print("\n📋 Testing Core Unit Tests...")
-    results.append(test_unit_core())
-    
-    print("\n🔧 Testing Tool Unit Tests...")
-    results.append(test_unit_tools())
-    
-    print("\n⚡ Testing Performance Tests...")
-    results.append(test_performance())
-    
+
+    print("\n📋 Testing Core Unit, Tool Unit and Performance Tests...")
+    results = run_tests(full=args.full, debug=args.debug)
+
     print("\n📊 Summary:")
-    print(f"Core Unit Tests: {'✅ PASS' if results[0] else '❌ FAIL'}")
-    print(f"Tool Unit Tests: {'✅ PASS' if results[1] else '❌ FAIL'}")
-    print(f"Performance Tests: {'✅ PASS' if results[2] else '❌ FAIL'}")
-    
-    if all(results):
+    for name, status in results:
+        print(f"{name}: {STATUS_LABELS[status]}")
+
+    if all(status != "fail" for _, status in results):
         print("\n🎉 All test optimizations working correctly!")
         return 0
     else:
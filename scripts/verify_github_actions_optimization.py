@@ -4,122 +4,282 @@ Verification script for GitHub Actions test optimization.
 This script simulates the exact test execution that will happen in GitHub Actions.
 """
 
-import subprocess
+import argparse
+import asyncio
+import json
+import os
+import signal
 import time
 import sys
+import xml.etree.ElementTree as ElementTree
+from collections import deque
 from pathlib import Path
 
-def run_command(cmd, description, timeout_minutes=20):
-    """Run a command with timeout and measure execution time."""
-    print(f"\n🔍 {description}")
-    print(f"Command: {' '.join(cmd)}")
-    print("-" * 60)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Incremental runs: only last run's failures (or everything if none failed),
+# failures first. Categories run side by side, so each keeps its own cache
+# directory rather than racing on one lastfailed file
+CACHE_DIR = ".pytest_cache"
+
+# Shared by every category; output, cache and results options are added per
+# run in main()
+PYTEST_COMMAND = ["python", "-m", "pytest", "--disable-warnings"]
+
+# Unit categories skip integration, real-API and performance tests
+UNIT_MARKS = ["-m", "not integration and not real_params and not performance"]
+
+# Quiet pytest output keeps CI logs small; --debug restores per-test lines
+# and full tracebacks
+QUIET_ARGS = ["-q", "--tb=line", "--no-header"]
+DEBUG_ARGS = ["-v", "--tb=long"]
+
+# Seconds a timed-out command gets to exit after SIGTERM before SIGKILL
+KILL_GRACE_SECONDS = 2
+
+# Lines of command output kept for the failure report
+OUTPUT_TAIL_LINES = 50
+
+
+# The two unit categories run at the same time; each gets up to half the
+# cores, with work stealing to balance uneven test files
+XDIST_ARGS = [
+    "-n", "auto", "--dist", "worksteal",
+    f"--maxprocesses={max(1, (os.cpu_count() or 2) // 2)}"
+]
+
+
+def category_dir(category_name):
+    """A category's directory under CACHE_DIR, relative to PROJECT_ROOT."""
+    return f"{CACHE_DIR}/{category_name.lower().replace(' ', '_')}"
+
+
+def cache_args(category_name):
+    """pytest options for a category's incremental run."""
+    return ["--lf", "--ff", "-o", f"cache_dir={category_dir(category_name)}"]
+
+
+def results_file(category_name):
+    """Where a category's JUnit XML results are written, relative to PROJECT_ROOT."""
+    return f"{category_dir(category_name)}/results.xml"
+
+
+def read_results(path):
+    """Summarize a JUnit XML results file, or None if it is missing or unreadable."""
+    try:
+        root = ElementTree.parse(path).getroot()
+    except (OSError, ElementTree.ParseError):
+        return None
+    totals = dict.fromkeys(("tests", "failures", "errors", "skipped"), 0)
+    duration = 0.0
+    for suite in root.iter("testsuite"):
+        for key in totals:
+            totals[key] += int(suite.get(key, 0))
+        duration += float(suite.get("time", 0))
+    passed = totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]
+    return (
+        f"{passed} passed, {totals['failures']} failed, {totals['errors']} errors, "
+        f"{totals['skipped']} skipped of {totals['tests']} in {duration:.2f}s"
+    )
+
+
+def cached_failure_count():
+    """Number of failures recorded by the last pytest runs, or None without a cache."""
+    counts = []
+    for lastfailed in (PROJECT_ROOT / CACHE_DIR).glob("*/v/cache/lastfailed"):
+        try:
+            counts.append(len(json.loads(lastfailed.read_text())))
+        except (OSError, ValueError):
+            continue
+    return sum(counts) if counts else None
+
+
+async def kill_process_group(process):
+    """Stop a command and every process it started, e.g. pytest-xdist workers."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), KILL_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        # Workers that outlived the grace period or their parent
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
+
+async def run_command(cmd, description, timeout_minutes=20, results_path=None):
+    """Run a command with timeout and measure execution time.
+    
+    Returns whether it passed and the report lines, which the caller prints
+    once all concurrently running commands are done. If the command writes
+    JUnit XML to results_path (relative to PROJECT_ROOT), its counts are
+    added to the report.
+    """
+    report = [
+        f"\n🔍 {description}",
+        f"Command: {' '.join(cmd)}",
+        "-" * 60
+    ]
+    
+    if results_path is not None:
+        results_path = PROJECT_ROOT / results_path
+        results_path.unlink(missing_ok=True)  # never report a previous run's results
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout_minutes * 60,
-            cwd=Path(__file__).parent.parent
+        # stderr is folded into stdout and only a tail of the output is kept,
+        # so a long verbose pytest log is never held in memory
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=PROJECT_ROOT,
+            start_new_session=True  # own process group, so xdist workers can be killed with it
         )
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
+        async def read_output():
+            async for raw in process.stdout:
+                tail.append(raw.decode(errors="replace").rstrip())
+            await process.wait()
+
+        try:
+            await asyncio.wait_for(read_output(), timeout_minutes * 60)
+        except asyncio.TimeoutError:
+            await kill_process_group(process)
+            report.append(f"⏰ TIMEOUT: {description} exceeded {timeout_minutes} minutes")
+            return False, report
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         
-        print(f"✅ Completed in {duration:.2f} seconds")
+        report.append(f"✅ Completed in {duration:.2f} seconds")
+        
+        results = read_results(results_path) if results_path is not None else None
+        if results is not None:
+            report.append(f"📊 Result: {results}")
         
-        if result.returncode == 0:
-            print(f"✅ PASSED: {description}")
-            # Show test count from output
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'passed' in line and ('warning' in line or 'error' in line or line.strip().endswith('passed')):
-                    print(f"📊 Result: {line.strip()}")
-                    break
+        if process.returncode == 0:
+            report.append(f"✅ PASSED: {description}")
         else:
-            print(f"❌ FAILED: {description}")
-            print("STDOUT:", result.stdout[-500:])  # Last 500 chars
-            print("STDERR:", result.stderr[-500:])  # Last 500 chars
-            return False
+            report.append(f"❌ FAILED: {description}")
+            report.append("OUTPUT (last {} lines):\n{}".format(len(tail), "\n".join(tail)))
+            return False, report
             
-        return True
+        return True, report
         
-    except subprocess.TimeoutExpired:
-        print(f"⏰ TIMEOUT: {description} exceeded {timeout_minutes} minutes")
-        return False
     except Exception as e:
-        print(f"💥 ERROR: {description} failed with exception: {e}")
-        return False
+        report.append(f"💥 ERROR: {description} failed with exception: {e}")
+        return False, report
 
-def main():
+async def main():
     """Run all test categories as they would run in GitHub Actions."""
+    parser = argparse.ArgumentParser(description="GitHub Actions test optimization verification")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run every test instead of only those that failed last time"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Show every test and full tracebacks"
+    )
+    args = parser.parse_args()
+    output_args = DEBUG_ARGS if args.debug else QUIET_ARGS
+
     print("🚀 GitHub Actions Test Optimization Verification")
     print("=" * 60)
+
+    failures = cached_failure_count()
+    if args.full:
+        print("🗂️  Pytest cache: ignored (--full)")
+    elif failures is None:
+        print("🗂️  Pytest cache: empty, running everything")
+    elif failures:
+        print(f"🗂️  Pytest cache: rerunning {failures} previously failed test(s) first")
+    else:
+        print("🗂️  Pytest cache: no recorded failures, running everything")
     
     # Test categories as defined in GitHub Actions
     test_categories = [
         {
             "name": "Core Unit Tests",
-            "cmd": [
-                "python", "-m", "pytest",
+            "cmd": PYTEST_COMMAND + [
                 "tests/test_registry.py",
                 "tests/test_error_handling.py", 
                 "tests/test_tool_health.py",
-                "-m", "not integration and not real_params and not performance",
-                "--tb=short", "-v", "--disable-warnings",
-                "--maxfail=5", "-n", "2", "--durations=3"
+                *UNIT_MARKS,
+                "--maxfail=5", *XDIST_ARGS, "--durations=3"
             ],
             "timeout": 15,
             "expected_max_time": 10  # seconds
         },
         {
             "name": "Tool Unit Tests",
-            "cmd": [
-                "python", "-m", "pytest",
+            "cmd": PYTEST_COMMAND + [
                 "tests/test_ai_analysis_tools.py",
                 "tests/test_static_analysis_tools.py",
                 "tests/test_filesystem_tools.py",
                 "tests/test_github_tools.py", 
                 "tests/test_communication_tools.py",
-                "-m", "not integration and not real_params and not performance",
-                "--tb=short", "-v", "--disable-warnings",
-                "--maxfail=10", "-n", "2", "--durations=3"
+                *UNIT_MARKS,
+                "--maxfail=10", *XDIST_ARGS, "--durations=3"
             ],
             "timeout": 20,
             "expected_max_time": 15  # seconds
         },
         {
             "name": "Performance Tests",
-            "cmd": [
-                "python", "-m", "pytest",
+            "cmd": PYTEST_COMMAND + [
                 "tests/test_performance.py",
                 "-m", "performance",
-                "--tb=short", "-v", "--disable-warnings",
-                "--maxfail=3", "--durations=5"
+                "--maxfail=3", "--durations=5",
+                "-n", "0"  # serial: parallel workers skew timing measurements
             ],
             "timeout": 10,
-            "expected_max_time": 30  # seconds
+            "expected_max_time": 30,  # seconds
+            "exclusive": True  # runs alone, after the other categories
         }
     ]
     
-    results = []
-    total_start_time = time.time()
+    total_start_time = time.perf_counter()
     
-    for category in test_categories:
-        success = run_command(
-            category["cmd"],
+    def run_category(category):
+        return run_command(
+            category["cmd"] + output_args
+            + ["--junit-xml", results_file(category["name"])]
+            + ([] if args.full else cache_args(category["name"])),
             category["name"],
-            category["timeout"]
+            category["timeout"],
+            results_path=results_file(category["name"])
         )
+    
+    # The unit categories share no state, so they run concurrently; exclusive
+    # categories (timing-sensitive ones) then run one at a time with the
+    # machine to themselves. Reports are printed in category order once all
+    # have finished
+    shared = [category for category in test_categories if not category.get("exclusive")]
+    outcomes_by_name = dict(zip(
+        (category["name"] for category in shared),
+        await asyncio.gather(*(run_category(category) for category in shared))
+    ))
+    for category in test_categories:
+        if category.get("exclusive"):
+            outcomes_by_name[category["name"]] = await run_category(category)
+    outcomes = [outcomes_by_name[category["name"]] for category in test_categories]
+    
+    results = []
+    for category, (success, report) in zip(test_categories, outcomes):
+        print("\n".join(report))
         results.append((category["name"], success))
         
         if not success:
             print(f"\n❌ CRITICAL: {category['name']} failed!")
-            break
     
-    total_time = time.time() - total_start_time
+    total_time = time.perf_counter() - total_start_time
     
     # Summary
     print("\n" + "=" * 60)
@@ -148,5 +308,5 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
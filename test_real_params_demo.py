@@ -22,6 +22,17 @@ from tests.unit.test_module_sanity import run_sanity_checks
 from tools_integration_runner import ToolIntegrationRunner
 
 
+def _has_github_token():
+    """Whether a GitHub token is configured for real API calls."""
+    return bool(os.getenv("GITHUB_TOKEN"))
+
+
+def _skipped():
+    """Result for a demo that needs real GitHub API access but has no token."""
+    print("⏭️  Skipped: GITHUB_TOKEN not set, real GitHub API calls would fail")
+    return {"overall_status": "SKIPPED"}
+
+
 def demo_sanity_check_with_real_params():
     """Demonstrate sanity checking with real GitHub parameters."""
     print("🎯 Demo: Sanity Check with Real GitHub Parameters")
@@ -37,13 +48,8 @@ def demo_sanity_check_with_real_params():
     print(f"📄 Testing with file: {real_params['test_file']}")
     print()
     
-    # Check if GitHub token is available
-    github_token = os.getenv("GITHUB_TOKEN")
-    if not github_token:
-        print("⚠️  WARNING: GITHUB_TOKEN not found in environment variables")
-        print("   Real GitHub API calls will fail without authentication")
-        print("   Set GITHUB_TOKEN environment variable for full testing")
-        print()
+    if not _has_github_token():
+        return _skipped()
     
     # Run sanity check with real parameters
     results = run_sanity_checks(
@@ -89,6 +95,9 @@ async def demo_integration_runner_with_real_params():
     print(f"📄 Testing with file: {real_params['test_file']}")
     print()
     
+    if not _has_github_token():
+        return _skipped()
+    
     # Create integration runner with real parameters
     runner = ToolIntegrationRunner(
         verbose=True,
@@ -123,12 +132,15 @@ def demo_mock_vs_real_comparison():
     )
     
     print("\n2️⃣ Running with REAL parameters...")
-    real_results = run_sanity_checks(
-        verbose=False,
-        category="github",
-        use_real_params=True,
-        real_params=real_params
-    )
+    if _has_github_token():
+        real_results = run_sanity_checks(
+            verbose=False,
+            category="github",
+            use_real_params=True,
+            real_params=real_params
+        )
+    else:
+        real_results = _skipped()
     
     print("\n📊 Comparison Results:")
     print(f"   Mock Test Status: {mock_results.get('overall_status', 'UNKNOWN')}")
@@ -145,6 +157,8 @@ def demo_mock_vs_real_comparison():
             print(f"      {tool_name}: {tool_result.get('status')} - {tool_result.get('message')}")
             if tool_result.get("data"):
                 print(f"         Real data retrieved: {len(tool_result['data'])} fields")
+    
+    return {"mock": mock_results, "real": real_results}
 
 
 def main():
@@ -156,38 +170,41 @@ def main():
     print()
     
     # Check environment
-    github_token = os.getenv("GITHUB_TOKEN")
-    if github_token:
+    if _has_github_token():
         print("✅ GitHub token found - real API calls will work")
     else:
-        print("⚠️  GitHub token not found - some tests may fail")
+        print("⚠️  GitHub token not found - demos needing the GitHub API will be skipped")
         print("   Set GITHUB_TOKEN environment variable for full functionality")
     
     print()
     
-    try:
-        # Demo 1: Basic sanity check with real parameters
-        demo_sanity_check_with_real_params()
-        
-        # Demo 2: Integration runner with real parameters
-        asyncio.run(demo_integration_runner_with_real_params())
-        
-        # Demo 3: Comparison between mock and real testing
-        demo_mock_vs_real_comparison()
-        
-        print("\n🎉 Demo completed successfully!")
-        print("\nNext steps:")
-        print("1. Set GITHUB_TOKEN environment variable for full API access")
-        print("2. Try running with different repositories and files")
-        print("3. Use the VSCode debug configurations for interactive testing")
-        print("4. Run: python tools_integration_runner.py --real-world-test --github-repo <your-repo>")
-        
-    except Exception as e:
-        print(f"\n❌ Demo failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    demos = (
+        demo_sanity_check_with_real_params,
+        lambda: asyncio.run(demo_integration_runner_with_real_params()),
+        demo_mock_vs_real_comparison,
+    )
+    
+    # Each demo runs even if an earlier one failed
+    success = True
+    for demo in demos:
+        try:
+            demo()
+        except Exception as e:
+            print(f"\n❌ Demo failed with error: {e}")
+            import traceback
+            traceback.print_exc()
+            success = False
+    
+    if not success:
         return False
     
+    print("\n🎉 Demo completed successfully!")
+    print("\nNext steps:")
+    print("1. Set GITHUB_TOKEN environment variable for full API access")
+    print("2. Try running with different repositories and files")
+    print("3. Use the VSCode debug configurations for interactive testing")
+    print("4. Run: python tools_integration_runner.py --real-world-test --github-repo <your-repo>")
+    
     return True
 
 
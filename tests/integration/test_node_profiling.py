@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Node Profiling Testing
+
+This module tests that the node profiler's CPU profiles cover both
+coroutine nodes and synchronous nodes run in an executor thread.
+
+Part of Milestone 2: Individual Node Testing & Workflow Debugging
+"""
+
+import pytest
+from pathlib import Path
+import sys
+import tracemalloc
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.node_profiling import NodeProfiler
+
+
+def busy_sync_node(state):
+    """Synchronous node doing measurable CPU work."""
+    return {"total": sum(i * i for i in range(20000))}
+
+
+async def busy_async_node(state):
+    """Coroutine node doing measurable CPU work."""
+    return {"total": sum(i * i for i in range(20000))}
+
+
+@pytest.fixture
+def profiler():
+    """Profiler whose only nodes are the busy nodes, inside a session."""
+    profiler = NodeProfiler(enable_memory_tracking=False)
+    profiler.available_nodes = {
+        "busy_sync_node": busy_sync_node,
+        "busy_async_node": busy_async_node,
+    }
+    profiler.start_profiling_session()
+    yield profiler
+    profiler.end_profiling_session()
+
+
+class TestNodeCPUProfiles:
+    """CPU profiles include the profiled node's own work."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("node_name", ["busy_sync_node", "busy_async_node"])
+    async def test_profile_includes_node_work(self, profiler, node_name):
+        """The node function and its callees show up in the profile."""
+        metrics = await profiler.profile_node_execution(node_name, {})
+
+        assert node_name in metrics.profile_data
+        assert metrics.function_calls > 20000
+
+    @pytest.mark.asyncio
+    async def test_sync_node_profiled_repeatedly(self, profiler):
+        """The shared profiler is released after profiling a synchronous node."""
+        for _ in range(3):
+            metrics = await profiler.profile_node_execution("busy_sync_node", {})
+            assert "busy_sync_node" in metrics.profile_data
+
+
+class TestMemoryTracking:
+    """tracemalloc is started once and left running between sessions."""
+
+    def test_tracing_survives_sessions_until_stopped(self):
+        """Sequential sessions reuse tracing; stop_memory_tracking() ends it."""
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already started outside the profiler")
+        profiler = NodeProfiler(enable_memory_tracking=True)
+        try:
+            for name in ("first", "second"):
+                profiler.start_profiling_session(name)
+                profiler.end_profiling_session()
+                assert tracemalloc.is_tracing()
+        finally:
+            profiler.stop_memory_tracking()
+
+        assert not tracemalloc.is_tracing()
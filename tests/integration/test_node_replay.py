@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Node Replay Delta Chain Testing
+
+This module tests that replay steps recorded as deltas against earlier steps
+round-trip through save/load and replay with their full input states.
+
+Part of Milestone 2: Individual Node Testing & Workflow Debugging
+"""
+
+import pytest
+from pathlib import Path
+from types import MappingProxyType
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from state import ReviewStatus
+import scripts.node_replay as node_replay
+from scripts.node_replay import NodeReplayEngine, ReplayMode
+from scripts.node_serialization import NodeSerializer, SerializationFormat
+
+
+async def echo_node(state):
+    """Node that returns its input, so replay output reflects the resolved input."""
+    return {"current_step": state["current_step"], "total_files": state["total_files"]}
+
+
+def create_state(step: int, **overrides):
+    """Create a review state that changes a little with every step."""
+    state = {
+        "messages": [],
+        "current_step": f"step_{step}",
+        "status": ReviewStatus.ANALYZING_CODE,
+        "repository_url": "https://github.com/test/replay-repo",
+        "enabled_tools": ["pylint_analysis"],
+        "tool_results": {},
+        "failed_tools": [],
+        "files_analyzed": [],
+        "total_files": step,
+        "review_config": {"replay_test": True},
+        "start_time": "2025-07-08T17:00:00",
+        "notifications_sent": [],
+        "report_generated": False
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.fixture
+def replay_engine(tmp_path):
+    """Replay engine whose only node is echo_node, saving under tmp_path."""
+    engine = NodeReplayEngine()
+    engine.available_nodes = MappingProxyType({"echo_node": echo_node})
+    engine._compiled_nodes = MappingProxyType({"echo_node": engine._compile_node(echo_node)})
+    engine.replay_dir = tmp_path
+    return engine
+
+
+async def record_chain(engine, length, state_for_step=create_state):
+    """Record length steps, each using the previous step as its delta base."""
+    steps = []
+    base_step = None
+    for i in range(length):
+        step = await engine.record_node_execution("echo_node", state_for_step(i), base_step=base_step)
+        steps.append(step)
+        base_step = step
+    return steps
+
+
+class TestReplayDeltaChains:
+    """Delta-encoded replay steps resolve to their full inputs."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_point_at_full_steps(self, replay_engine):
+        """Deltas are recorded against a full step, never another delta."""
+        steps = await record_chain(replay_engine, 100)
+        full_ids = {step.step_id for step in steps if step.base_step_id is None}
+
+        assert steps[0].base_step_id is None
+        assert any(step.base_step_id is not None for step in steps)
+        assert all(step.base_step_id is None or step.base_step_id in full_ids for step in steps)
+        # A full snapshot is stored at least every _DELTAS_PER_SNAPSHOT + 1 steps
+        assert len(full_ids) >= len(steps) // (node_replay._DELTAS_PER_SNAPSHOT + 1)
+
+    @pytest.mark.asyncio
+    async def test_long_chain_round_trip(self, replay_engine, monkeypatch):
+        """A sequence longer than the step history saves, loads and replays."""
+        monkeypatch.setattr(node_replay, "_REPLAY_HISTORY_SIZE", 64)
+        steps = await record_chain(replay_engine, 200)
+        sequence = replay_engine.create_replay_sequence("Long Chain", "delta chain", steps)
+        filepath = replay_engine.save_replay_sequence(sequence)
+
+        loader = NodeReplayEngine()
+        loader.available_nodes = replay_engine.available_nodes
+        loader._compiled_nodes = MappingProxyType({"echo_node": loader._compile_node(echo_node)})
+        loaded = loader.load_replay_sequence(filepath)
+        results = await loader.replay_sequence(loaded)
+
+        assert len(results) == 200
+        assert all(result.success for result in results), [r.error_message for r in results if not r.success]
+        assert all(not result.differences for result in results)
+        assert [result.actual_output["total_files"] for result in results] == list(range(200))
+
+    @pytest.mark.asyncio
+    async def test_removed_fields_are_stored_in_full(self, replay_engine):
+        """A step whose input drops fields of its base is not stored as a delta."""
+        def state_for_step(i):
+            state = create_state(i, retry_context={"attempt": i})
+            if i % 2:
+                del state["retry_context"]
+            return state
+
+        steps = await record_chain(replay_engine, 6, state_for_step)
+
+        for i, step in enumerate(steps):
+            materialized = replay_engine._materialize_input(step)
+            assert materialized.get("retry_context") == (None if i % 2 else {"attempt": i})
+            assert materialized["total_files"] == i
+        # step 1 drops a field its base step 0 has, so it can't be a delta
+        assert steps[1].base_step_id is None
+
+    def test_unknown_base_is_reported(self, replay_engine):
+        """Resolving a delta whose base was never loaded fails clearly."""
+        step = replay_engine.create_replay_step("echo_node", {"total_files": 1}, base_step_id="missing")
+
+        with pytest.raises(ValueError, match="Base step missing"):
+            replay_engine._materialize_input(step)
+
+
+class TestReplayFiles:
+    """Saved sequences keep every payload format intact."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("msgpack_file", [True, False], ids=["mpk", "json"])
+    @pytest.mark.parametrize("format", [
+        SerializationFormat.JSON,
+        SerializationFormat.PICKLE,
+        SerializationFormat.COMPRESSED_JSON,
+    ], ids=lambda f: f.value)
+    async def test_payload_round_trip(self, replay_engine, monkeypatch, msgpack_file, format):
+        """Text and binary payloads load back byte for byte and replay."""
+        if msgpack_file and node_replay._ENCODER is None:
+            pytest.skip("msgspec not installed")
+        if not msgpack_file:
+            monkeypatch.setattr(node_replay, "_ENCODER", None)
+        replay_engine.serializer = NodeSerializer(default_format=format, compress_threshold=0)
+        steps = await record_chain(replay_engine, 3)
+        sequence = replay_engine.create_replay_sequence("Formats", "payload formats", steps)
+        filepath = replay_engine.save_replay_sequence(sequence)
+
+        loaded = replay_engine.load_replay_sequence(filepath)
+        results = await replay_engine.replay_sequence(loaded)
+
+        assert filepath.suffix == (".mpk" if msgpack_file else ".json")
+        assert [step.input_data.data for step in loaded.steps] == [step.input_data.data for step in steps]
+        assert all(isinstance(step.input_data.data, bytes) for step in loaded.steps)
+        assert all(result.success and not result.differences for result in results)
+
+
+class TestReplayStepErrors:
+    """A step that raises is reported as a failed result in every mode."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", list(ReplayMode), ids=lambda m: m.value)
+    async def test_unknown_node_becomes_failed_result(self, replay_engine, monkeypatch, mode):
+        """Replaying a node the engine doesn't know fails that step only."""
+        monkeypatch.setattr("builtins.input", lambda prompt="": "")
+        replay_engine.mode = mode
+        steps = [
+            replay_engine.create_replay_step("echo_node", create_state(0)),
+            replay_engine.create_replay_step("missing_node", create_state(1)),
+            replay_engine.create_replay_step("echo_node", create_state(2)),
+        ]
+        sequence = replay_engine.create_replay_sequence("Errors", "unknown node", steps)
+
+        results = await replay_engine.replay_sequence(sequence)
+
+        assert results[0].success
+        assert not results[1].success
+        assert "missing_node" in results[1].error_message
+        assert all(result.sequence_id == sequence.sequence_id for result in results)
+        # DEBUG mode stops at the first failed step
+        assert len(results) == (2 if mode == ReplayMode.DEBUG else 3)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Node Serialization File Round-Trip Testing
+
+This module tests that serialized node data saved to disk, inline JSON or a
+binary sidecar file, loads back unchanged.
+
+Part of Milestone 2: Individual Node Testing & Workflow Debugging
+"""
+
+import pytest
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from state import ReviewStatus
+import scripts.node_serialization as node_serialization
+from scripts.node_serialization import NodeSerializer, SerializationFormat
+
+
+BINARY_FORMATS = [
+    SerializationFormat.PICKLE,
+    SerializationFormat.COMPRESSED_JSON,
+    SerializationFormat.MSGPACK,
+]
+
+
+def create_state(current_step: str = "analyze_code"):
+    """Create a review state for serialization."""
+    return {
+        "messages": [],
+        "current_step": current_step,
+        "status": ReviewStatus.ANALYZING_CODE,
+        "repository_url": "https://github.com/test/serialization-repo",
+        "enabled_tools": ["pylint_analysis", "code_review"],
+        "tool_results": {},
+        "failed_tools": [],
+        "files_analyzed": [f"src/module_{i}.py" for i in range(50)],
+        "total_files": 50,
+        "review_config": {"serialization_test": True},
+        "start_time": "2025-07-08T17:00:00",
+        "notifications_sent": [],
+        "report_generated": False
+    }
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, tmp_path, monkeypatch):
+    """Serializer writing under tmp_path, loading with orjson (mmap) or json."""
+    if request.param == "json":
+        monkeypatch.setattr(node_serialization, "orjson", None)
+    elif node_serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    # compress_threshold=0 so COMPRESSED_JSON always produces a binary payload
+    serializer = NodeSerializer(compress_threshold=0)
+    serializer.serialization_dir = tmp_path
+    return serializer
+
+
+def assert_round_trip(serializer, serialized, filename):
+    """Save and load serialized, checking the loaded copy matches."""
+    filepath = serializer.save_serialized_data(serialized, filename)
+    loaded = serializer.load_serialized_data(filepath)
+
+    assert isinstance(serialized.data, bytes)
+    assert loaded.data == serialized.data
+    assert loaded.metadata.format == serialized.metadata.format
+    assert loaded.metadata.checksum == serialized.metadata.checksum
+    assert serializer.deserialize_node_input(loaded)["current_step"] == \
+        serializer.deserialize_node_input(serialized)["current_step"]
+    return filepath
+
+
+class TestSerializedDataFiles:
+    """save_serialized_data/load_serialized_data round trips."""
+
+    def test_json_round_trip(self, serializer):
+        """JSON payloads are stored inline without a sidecar file."""
+        serialized = serializer.serialize_node_input("analyze_code_node", create_state(),
+                                                     format=SerializationFormat.JSON)
+        filepath = assert_round_trip(serializer, serialized, "inline.json")
+
+        assert list(filepath.parent.iterdir()) == [filepath]
+
+    @pytest.mark.parametrize("format", BINARY_FORMATS, ids=lambda f: f.value)
+    def test_binary_round_trip(self, serializer, format):
+        """Binary payloads are written to a <filename>.bin sidecar."""
+        serialized = serializer.serialize_node_input("analyze_code_node", create_state(), format=format)
+        filepath = assert_round_trip(serializer, serialized, "payload.json")
+
+        assert (filepath.parent / "payload.json.bin").read_bytes() == serialized.data
+
+    def test_bin_filename_keeps_its_payload(self, serializer):
+        """A filename ending in .bin is not overwritten by its own metadata."""
+        serialized = serializer.serialize_node_input("analyze_code_node", create_state(),
+                                                     format=SerializationFormat.PICKLE)
+
+        assert_round_trip(serializer, serialized, "payload.bin")
+
+    def test_names_differing_by_extension_do_not_share_a_sidecar(self, serializer):
+        """x.v1 and x.v2 each keep their own binary payload."""
+        first = serializer.serialize_node_input("analyze_code_node", create_state("first"),
+                                                format=SerializationFormat.PICKLE)
+        second = serializer.serialize_node_input("analyze_code_node", create_state("second"),
+                                                 format=SerializationFormat.PICKLE)
+        first_path = serializer.save_serialized_data(first, "x.v1")
+        second_path = serializer.save_serialized_data(second, "x.v2")
+
+        assert serializer.deserialize_node_input(
+            serializer.load_serialized_data(first_path))["current_step"] == "first"
+        assert serializer.deserialize_node_input(
+            serializer.load_serialized_data(second_path))["current_step"] == "second"
+
+    def test_empty_file_is_rejected(self, serializer, tmp_path):
+        """An empty file fails to parse rather than failing to map."""
+        empty = tmp_path / "empty.json"
+        empty.touch()
+
+        with pytest.raises(json.JSONDecodeError):
+            serializer.load_serialized_data(empty)
+
+
+class TestSerializationSummary:
+    """Running totals stay exact when serializations run in threads."""
+
+    def test_concurrent_serializations_are_all_counted(self, serializer):
+        """Every serialization from every thread is counted once."""
+        def serialize(_):
+            serializer.serialize_node_input("analyze_code_node", create_state(),
+                                            format=SerializationFormat.MSGPACK)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(serialize, range(400)))
+        summary = serializer.get_serialization_summary()
+
+        assert summary["total_operations"] == 400
+        assert summary["operations_by_format"][SerializationFormat.MSGPACK.value] == 400
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Node Tracing Testing
+
+This module tests the state changes and performance analysis that
+@traced_node records for each node execution.
+
+Part of Milestone 2: Individual Node Testing & Workflow Debugging
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import scripts.node_tracing as node_tracing
+from scripts.node_tracing import NodeTracer, traced_node
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    """Global tracer with state tracking on, writing under tmp_path."""
+    tracer = NodeTracer(enable_state_tracking=True, trace_output_dir=str(tmp_path))
+    monkeypatch.setattr(node_tracing, "_global_tracer", tracer)
+    monkeypatch.setattr(node_tracing, "_tracing_enabled", True)
+    return tracer
+
+
+def changes_by_field(trace):
+    """State changes of trace keyed by field."""
+    return {change["field"]: change for change in trace.state_changes}
+
+
+class TestTracedNodeStateChanges:
+    """@traced_node records the changes a node's update makes to the state."""
+
+    @pytest.mark.asyncio
+    async def test_returned_update_is_diffed(self, tracer):
+        """Modified and added keys in the returned update are recorded."""
+        @traced_node
+        async def update_node(state):
+            return {"current_step": "done", "total_files": 3}
+
+        await update_node({"current_step": "start"})
+        changes = changes_by_field(tracer.completed_traces[-1])
+
+        assert changes["current_step"]["change_type"] == "modified"
+        assert changes["current_step"]["old_value"] == "start"
+        assert changes["total_files"]["change_type"] == "added"
+
+    @pytest.mark.asyncio
+    async def test_node_assigning_to_its_input_is_diffed(self, tracer):
+        """A key the node also assigns in its input is diffed against the original value."""
+        @traced_node
+        async def mutating_node(state):
+            state["current_step"] = "done"
+            return {"current_step": "done"}
+
+        await mutating_node({"current_step": "start"})
+        changes = changes_by_field(tracer.completed_traces[-1])
+
+        assert changes["current_step"]["old_value"] == "start"
+        assert changes["current_step"]["new_value"] == "done"
+
+
+class TestPerformanceAnalysis:
+    """_analyze_performance reports the same shape under and over thresholds."""
+
+    @pytest.mark.parametrize("execution_time,score", [(0.01, "good"), (10.0, "fair"), (60.0, "poor")])
+    def test_warnings_are_a_list(self, tracer, execution_time, score):
+        """performance_warnings is a list whichever threshold applies."""
+        tracer.performance_thresholds = dict(tracer.performance_thresholds,
+                                             execution_time_warning=5.0, execution_time_error=30.0)
+        trace_id = tracer.start_trace("timed_node", {})
+        trace = tracer.active_traces[trace_id]
+        trace.execution_time = execution_time
+
+        analysis = tracer._analyze_performance(trace)
+
+        assert analysis["performance_score"] == score
+        assert isinstance(analysis["performance_warnings"], list)
+        assert len(analysis["performance_warnings"]) == (score != "good")